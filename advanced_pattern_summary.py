@@ -6,42 +6,102 @@ Focuses on key findings without complex statistical tests that may fail.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from lottery_stats import most_common
 import warnings
 warnings.filterwarnings('ignore')
 
+# Lookup tables for prime and Fibonacci membership of numbers 0-69
+_PRIME_LUT = np.zeros(70, dtype=bool)
+_PRIME_LUT[[2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67]] = True
+_FIB_LUT = np.zeros(70, dtype=bool)
+_FIB_LUT[[1, 2, 3, 5, 8, 13, 21, 34, 55]] = True
+
+def moving_average(values, window=50):
+    """Return the trailing moving average over full windows only."""
+    return np.convolve(values, np.ones(window) / window, mode='valid')
+
+def max_run(gaps):
+    """Return the longest run of consecutive numbers in each draw as an int8 array."""
+    # Walk the gap columns, carrying the current run length for every draw at once
+    current = np.ones(len(gaps), dtype=np.int8)
+    longest = np.ones(len(gaps), dtype=np.int8)
+    for is_consecutive in (gaps == 1).T:
+        current = np.where(is_consecutive, current + 1, 1).astype(np.int8)
+        np.maximum(longest, current, out=longest)
+    return longest
+
+def group_means(keys, values, size):
+    """Return per-key means (rounded to 2 places) and counts for small non-negative int keys."""
+    counts = np.bincount(keys, minlength=size)
+    totals = np.bincount(keys, weights=values, minlength=size)
+    with np.errstate(invalid='ignore'):
+        return np.round(totals / counts, 2), counts
+
+def fit_eval_kmeans(k, X_scaled):
+    """Fit mini-batch K-Means for one k and return (k, sampled silhouette score, labels)."""
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.metrics import silhouette_score
+    
+    kmeans = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3, batch_size=1024)
+    cluster_labels = kmeans.fit_predict(X_scaled)
+    score = silhouette_score(X_scaled, cluster_labels, sample_size=min(2000, len(X_scaled)), random_state=42)
+    return k, score, cluster_labels
+
+def compute_features(wb, sorted_wb, gaps):
+    """Compute every per-draw feature column from the draws, their sorted rows and gaps."""
+    low_count = (wb <= 34).sum(axis=1)
+    high_count = 5 - low_count
+    even_count = (wb % 2 == 0).sum(axis=1, dtype=np.int8)
+    # Mean and population std of five numbers from the sum and sum of squares
+    sums = wb.sum(axis=1, dtype=np.int16)
+    sum_sq = (wb.astype(np.int32) ** 2).sum(axis=1)
+    mean = sums / 5.0
+    
+    return {
+        # Basic features
+        'Sum': sums,
+        'Mean': mean,
+        'Std': np.sqrt(np.maximum(sum_sq / 5.0 - mean ** 2, 0)),
+        'Range': sorted_wb[:, -1] - sorted_wb[:, 0],
+        'Even_Count': even_count,
+        'Odd_Count': 5 - even_count,
+        # Advanced features
+        'Consecutive_Pairs': (gaps == 1).sum(axis=1),
+        'Max_Run': max_run(gaps),
+        'Gap_Variance': gaps.var(axis=1),
+        # Cap at 5 when every number is low
+        'Low_High_Ratio': np.where(high_count > 0, low_count / np.maximum(high_count, 1), 5.0),
+        'Prime_Count': _PRIME_LUT[wb].sum(axis=1),
+        'Fibonacci_Count': _FIB_LUT[wb].sum(axis=1),
+    }
+
 class AdvancedPatternSummary:
     def __init__(self, csv_file):
         """Initialize the advanced analyzer with lottery data."""
         self.csv_file = csv_file
         self.df = None
-        self.white_balls = []
-        self.powerballs = []
+        self.wb = None
+        self.pb = None
+        # Results cached by the analyses for reuse in the visualizations
+        self._corr = None
+        self._X_scaled = None
         self.load_data()
         self.prepare_features()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data for advanced analysis...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
-        
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
-        
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
+        # Only the date and numbers are used; parse the date while reading
+        self.df = pd.read_csv(self.csv_file, usecols=['Draw Date', 'Winning Numbers'],
+                              parse_dates=['Draw Date'], date_format='%m/%d/%Y',
+                              dtype={'Winning Numbers': 'string'})
+        
+        # Parse winning numbers into an (N, 5) white ball matrix and a powerball vector
+        numbers = self.df['Winning Numbers'].str.split(expand=True).astype(np.int8).to_numpy()
+        self.wb = np.ascontiguousarray(numbers[:, :5])
+        self.pb = np.ascontiguousarray(numbers[:, 5])
+        self.df['Powerball'] = self.pb
+        self.white_flat = self.wb.ravel()
         
         print(f"Loaded {len(self.df)} lottery draws from {self.df['Draw Date'].min().strftime('%Y-%m-%d')} to {self.df['Draw Date'].max().strftime('%Y-%m-%d')}")
     
@@ -49,59 +109,21 @@ class AdvancedPatternSummary:
         """Prepare advanced features for pattern analysis."""
         print("Preparing advanced features...")
         
-        # Basic features
-        self.df['Sum'] = self.df['White Balls'].apply(sum)
-        self.df['Mean'] = self.df['White Balls'].apply(np.mean)
-        self.df['Std'] = self.df['White Balls'].apply(np.std)
-        self.df['Range'] = self.df['White Balls'].apply(lambda x: max(x) - min(x))
-        self.df['Even_Count'] = self.df['White Balls'].apply(lambda x: sum(1 for num in x if num % 2 == 0))
-        self.df['Odd_Count'] = 5 - self.df['Even_Count']
-        
-        # Advanced features
-        self.df['Consecutive_Pairs'] = self.df['White Balls'].apply(self._count_consecutive_pairs)
-        self.df['Gap_Variance'] = self.df['White Balls'].apply(self._calculate_gap_variance)
-        self.df['Low_High_Ratio'] = self.df['White Balls'].apply(self._calculate_low_high_ratio)
-        self.df['Prime_Count'] = self.df['White Balls'].apply(self._count_primes)
-        self.df['Fibonacci_Count'] = self.df['White Balls'].apply(self._count_fibonacci)
+        wb = self.wb
+        # Sort each draw once; every feature below reads the sorted rows or their gaps
+        self.wb_sorted = sorted_wb = np.sort(wb, axis=1)
+        # Gaps between sorted numbers, shared with the sequence analysis and plots
+        self.gaps = gaps = np.diff(sorted_wb, axis=1)
+        self._all_gaps = gaps.ravel()
+        self.df = self.df.assign(**compute_features(wb, sorted_wb, gaps))
         
-        # Time-based features
-        self.df['Day_of_Week'] = self.df['Draw Date'].dt.dayofweek
-        self.df['Month'] = self.df['Draw Date'].dt.month
-        self.df['Year'] = self.df['Draw Date'].dt.year
+        # Time-based features (small ints; years need int16)
+        self.df['Day_of_Week'] = self.df['Draw Date'].dt.dayofweek.astype(np.int8)
+        self.df['Month'] = self.df['Draw Date'].dt.month.astype(np.int8)
+        self.df['Year'] = self.df['Draw Date'].dt.year.astype(np.int16)
         
         print("Advanced features prepared successfully!")
     
-    def _count_consecutive_pairs(self, numbers):
-        """Count consecutive number pairs in a draw."""
-        sorted_nums = sorted(numbers)
-        consecutive = 0
-        for i in range(len(sorted_nums) - 1):
-            if sorted_nums[i+1] - sorted_nums[i] == 1:
-                consecutive += 1
-        return consecutive
-    
-    def _calculate_gap_variance(self, numbers):
-        """Calculate variance of gaps between numbers."""
-        sorted_nums = sorted(numbers)
-        gaps = [sorted_nums[i+1] - sorted_nums[i] for i in range(len(sorted_nums) - 1)]
-        return np.var(gaps) if len(gaps) > 0 else 0
-    
-    def _calculate_low_high_ratio(self, numbers):
-        """Calculate ratio of low numbers (1-34) to high numbers (35-69)."""
-        low_count = sum(1 for num in numbers if num <= 34)
-        high_count = 5 - low_count
-        return low_count / high_count if high_count > 0 else 5.0
-    
-    def _count_primes(self, numbers):
-        """Count prime numbers in a draw."""
-        primes = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67}
-        return sum(1 for num in numbers if num in primes)
-    
-    def _count_fibonacci(self, numbers):
-        """Count Fibonacci numbers in a draw."""
-        fibs = {1, 2, 3, 5, 8, 13, 21, 34, 55}
-        return sum(1 for num in numbers if num in fibs)
-    
     def advanced_sequence_analysis(self):
         """Advanced sequence pattern analysis."""
         print("\n" + "="*70)
@@ -109,52 +131,37 @@ class AdvancedPatternSummary:
         print("="*70)
         
         # Gap analysis
-        all_gaps = []
-        for _, row in self.df.iterrows():
-            sorted_nums = sorted(row['White Balls'])
-            gaps = [sorted_nums[i+1] - sorted_nums[i] for i in range(len(sorted_nums) - 1)]
-            all_gaps.extend(gaps)
-        
-        gap_freq = Counter(all_gaps)
+        all_gaps = self._all_gaps
+        gap_counts = np.bincount(all_gaps)
         print(f"\n📊 Most common gaps between consecutive numbers:")
-        for gap, count in gap_freq.most_common(10):
+        for gap in most_common(all_gaps, gap_counts)[:10].tolist():
+            count = gap_counts[gap]
             print(f"   Gap of {gap:2d}: {count:4d} times ({count/len(all_gaps)*100:.1f}%)")
         
         # Sequence length analysis
-        sequence_lengths = []
-        for _, row in self.df.iterrows():
-            sorted_nums = sorted(row['White Balls'])
-            max_seq_len = 1
-            current_seq_len = 1
-            
-            for i in range(len(sorted_nums) - 1):
-                if sorted_nums[i+1] - sorted_nums[i] == 1:
-                    current_seq_len += 1
-                    max_seq_len = max(max_seq_len, current_seq_len)
-                else:
-                    current_seq_len = 1
-            
-            sequence_lengths.append(max_seq_len)
-        
-        seq_freq = Counter(sequence_lengths)
+        sequence_lengths = self.df['Max_Run'].to_numpy()
+        seq_freq = np.bincount(sequence_lengths)
         print(f"\n🔗 Maximum consecutive sequence lengths:")
-        for length, count in sorted(seq_freq.items()):
-            print(f"   Length {length}: {count:4d} draws ({count/len(sequence_lengths)*100:.1f}%)")
+        for length in np.flatnonzero(seq_freq):
+            print(f"   Length {length}: {seq_freq[length]:4d} draws ({seq_freq[length]/len(sequence_lengths)*100:.1f}%)")
         
-        # Position analysis
-        position_freq = defaultdict(Counter)
-        for _, row in self.df.iterrows():
-            sorted_nums = sorted(row['White Balls'])
-            for pos, num in enumerate(sorted_nums):
-                position_freq[pos][num] += 1
+        # Position analysis: one bincount over column-offset codes gives a (5, 70) table
+        codes = (self.wb_sorted + np.arange(0, 350, 70)).ravel()
+        self.position_counts = np.bincount(codes, minlength=350).reshape(5, 70)
         
         print(f"\n🎯 Most frequent numbers by position (when sorted):")
         positions = ['1st (lowest)', '2nd', '3rd (middle)', '4th', '5th (highest)']
         for pos in range(5):
-            print(f"   {positions[pos]:12s}: {position_freq[pos].most_common(3)}")
+            counts = self.position_counts[pos]
+            top = [(num, int(counts[num])) for num in most_common(self.wb_sorted[:, pos], counts)[:3].tolist()]
+            print(f"   {positions[pos]:12s}: {top}")
     
     def clustering_analysis(self):
         """Perform clustering analysis on lottery draws."""
+        # sklearn is imported here so loading the module stays cheap
+        from sklearn.preprocessing import StandardScaler
+        from joblib import Parallel, delayed
+        
         print("\n" + "="*70)
         print("🤖 MACHINE LEARNING CLUSTERING ANALYSIS")
         print("="*70)
@@ -170,30 +177,19 @@ class AdvancedPatternSummary:
         
         scaler = StandardScaler()
         X_scaled = scaler.fit_transform(X)
+        self._X_scaled = X_scaled
         
-        # K-Means clustering
+        # K-Means clustering (mini-batch, with a sampled silhouette to avoid O(N^2) distances)
         print("\n🔍 Testing different cluster numbers:")
-        best_k = 2
-        best_score = -1
-        
-        for k in range(2, 8):
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            cluster_labels = kmeans.fit_predict(X_scaled)
-            
-            # Calculate silhouette score
-            from sklearn.metrics import silhouette_score
-            score = silhouette_score(X_scaled, cluster_labels)
-            
-            if score > best_score:
-                best_score = score
-                best_k = k
-            
+        # Each k is independent, so fit them on a thread pool
+        results = Parallel(n_jobs=-1, prefer='threads')(
+            delayed(fit_eval_kmeans)(k, X_scaled) for k in range(2, 8))
+        for k, score, _ in results:
             print(f"   K={k}: Silhouette Score = {score:.3f}")
         
-        # Final clustering with best k
-        kmeans = KMeans(n_clusters=best_k, random_state=42, n_init=10)
-        cluster_labels = kmeans.fit_predict(X_scaled)
-        self.df['Cluster'] = cluster_labels
+        # Keep the best model's labels rather than refitting it
+        best_k, best_score, best_labels = max(results, key=lambda result: result[1])
+        self.df['Cluster'] = best_labels
         
         print(f"\n✅ Best clustering: K={best_k} (Silhouette Score = {best_score:.3f})")
         
@@ -214,49 +210,43 @@ class AdvancedPatternSummary:
         print("📅 TEMPORAL PATTERN ANALYSIS")
         print("="*70)
         
+        # Group means via weighted bincounts over the integer date keys
+        sums = self.df['Sum'].to_numpy()
+        evens = self.df['Even_Count'].to_numpy()
+        
         # Day of week analysis
-        dow_stats = self.df.groupby('Day_of_Week').agg({
-            'Sum': ['mean', 'std'],
-            'Even_Count': 'mean',
-            'Consecutive_Pairs': 'mean'
-        }).round(2)
+        dow = self.df['Day_of_Week'].to_numpy()
+        dow_sum, dow_count = group_means(dow, sums, 7)
+        dow_even, _ = group_means(dow, evens, 7)
         
         days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         print(f"\n📊 Day of week patterns:")
         for i, day in enumerate(days):
-            if i in dow_stats.index:
-                sum_mean = dow_stats.loc[i, ('Sum', 'mean')]
-                even_mean = dow_stats.loc[i, ('Even_Count', 'mean')]
-                print(f"   {day:9s}: Avg Sum={sum_mean:6.1f}, Avg Even={even_mean:.1f}")
+            if dow_count[i]:
+                print(f"   {day:9s}: Avg Sum={dow_sum[i]:6.1f}, Avg Even={dow_even[i]:.1f}")
         
         # Monthly patterns
-        monthly_stats = self.df.groupby('Month').agg({
-            'Sum': ['mean', 'std'],
-            'Even_Count': 'mean'
-        }).round(2)
+        month_key = self.df['Month'].to_numpy()
+        month_sum, month_count = group_means(month_key, sums, 13)
+        month_even, _ = group_means(month_key, evens, 13)
         
         months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
         
         print(f"\n📅 Monthly patterns:")
         for month in range(1, 13):
-            if month in monthly_stats.index:
-                sum_mean = monthly_stats.loc[month, ('Sum', 'mean')]
-                even_mean = monthly_stats.loc[month, ('Even_Count', 'mean')]
-                print(f"   {months[month-1]:3s}: Avg Sum={sum_mean:6.1f}, Avg Even={even_mean:.1f}")
-        
-        # Yearly trends
-        yearly_stats = self.df.groupby('Year').agg({
-            'Sum': 'mean',
-            'Even_Count': 'mean',
-            'Consecutive_Pairs': 'mean'
-        }).round(2)
+            if month_count[month]:
+                print(f"   {months[month-1]:3s}: Avg Sum={month_sum[month]:6.1f}, Avg Even={month_even[month]:.1f}")
+        
+        # Yearly trends, keyed by offset from the first year
+        first_year = self.df['Year'].min()
+        year = self.df['Year'].to_numpy() - first_year
+        year_sum, year_count = group_means(year, sums, year.max() + 1)
+        year_even, _ = group_means(year, evens, year.max() + 1)
         
         print(f"\n📈 Yearly trends (last 5 years):")
-        for year in sorted(yearly_stats.index)[-5:]:
-            sum_mean = yearly_stats.loc[year, 'Sum']
-            even_mean = yearly_stats.loc[year, 'Even_Count']
-            print(f"   {year}: Avg Sum={sum_mean:6.1f}, Avg Even={even_mean:.1f}")
+        for offset in np.flatnonzero(year_count)[-5:]:
+            print(f"   {first_year + offset}: Avg Sum={year_sum[offset]:6.1f}, Avg Even={year_even[offset]:.1f}")
     
     def advanced_frequency_analysis(self):
         """Advanced frequency analysis with statistical insights."""
@@ -265,45 +255,40 @@ class AdvancedPatternSummary:
         print("="*70)
         
         # White ball analysis
-        white_freq = Counter(self.white_balls)
-        expected_freq = len(self.white_balls) / 69
+        white_counts = np.bincount(self.white_flat, minlength=70)[1:70]
+        expected_freq = len(self.white_flat) / 69
+        z_scores = (white_counts - expected_freq) / np.sqrt(expected_freq)
         
         print(f"\n🔥 HOTTEST WHITE BALLS (Z-score > 2):")
-        hot_numbers = []
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_freq) / np.sqrt(expected_freq)
-            if z_score > 2:
-                hot_numbers.append((num, z_score, observed_count))
-        
-        for num, z_score, count in sorted(hot_numbers, key=lambda x: x[1], reverse=True):
-            print(f"   Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
+        hot_idx = np.flatnonzero(z_scores > 2)
+        for i in hot_idx[np.argsort(-z_scores[hot_idx], kind='stable')]:
+            print(f"   Number {i + 1:2d}: Z-score = {z_scores[i]:6.2f} ({white_counts[i]:3d} times)")
         
         print(f"\n❄️  COLDEST WHITE BALLS (Z-score < -2):")
-        cold_numbers = []
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_freq) / np.sqrt(expected_freq)
-            if z_score < -2:
-                cold_numbers.append((num, z_score, observed_count))
-        
-        for num, z_score, count in sorted(cold_numbers, key=lambda x: x[1]):
-            print(f"   Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
+        cold_idx = np.flatnonzero(z_scores < -2)
+        for i in cold_idx[np.argsort(z_scores[cold_idx], kind='stable')]:
+            print(f"   Number {i + 1:2d}: Z-score = {z_scores[i]:6.2f} ({white_counts[i]:3d} times)")
         
         # Powerball analysis
-        pb_freq = Counter(self.powerballs)
-        expected_pb = len(self.powerballs) / 26
+        pb_counts = np.bincount(self.pb, minlength=27)
+        expected_pb = len(self.pb) / 26
+        # Ranked like Counter.most_common, so ties go to the first-seen powerball
+        pb_ranked = most_common(self.pb, pb_counts)
+        most_pb, least_pb = pb_ranked[0], pb_ranked[-1]
         
         print(f"\n🎯 POWERBALL ANALYSIS:")
-        print(f"   Most frequent: {pb_freq.most_common(1)[0][0]} ({pb_freq.most_common(1)[0][1]} times)")
-        print(f"   Least frequent: {pb_freq.most_common()[-1][0]} ({pb_freq.most_common()[-1][1]} times)")
+        print(f"   Most frequent: {most_pb} ({pb_counts[most_pb]} times)")
+        print(f"   Least frequent: {least_pb} ({pb_counts[least_pb]} times)")
         
         # Statistical significance
         print(f"\n📈 STATISTICAL INSIGHTS:")
         print(f"   Expected frequency per white ball: {expected_freq:.1f}")
-        print(f"   Most frequent white ball: {white_freq.most_common(1)[0][0]} ({white_freq.most_common(1)[0][1]} times)")
-        print(f"   Least frequent white ball: {white_freq.most_common()[-1][0]} ({white_freq.most_common()[-1][1]} times)")
-        print(f"   Difference: {white_freq.most_common(1)[0][1] - white_freq.most_common()[-1][1]} times")
+        white_by_number = np.bincount(self.white_flat)
+        white_ranked = most_common(self.white_flat, white_by_number)
+        most_white, least_white = white_ranked[0], white_ranked[-1]
+        print(f"   Most frequent white ball: {most_white} ({white_by_number[most_white]} times)")
+        print(f"   Least frequent white ball: {least_white} ({white_by_number[least_white]} times)")
+        print(f"   Difference: {white_by_number[most_white] - white_by_number[least_white]} times")
     
     def correlation_analysis(self):
         """Analyze correlations between different features."""
@@ -315,7 +300,7 @@ class AdvancedPatternSummary:
         features = ['Sum', 'Mean', 'Std', 'Range', 'Even_Count', 'Consecutive_Pairs',
                    'Gap_Variance', 'Low_High_Ratio', 'Prime_Count', 'Powerball']
         
-        corr_matrix = self.df[features].corr()
+        corr_matrix = self._corr = self.df[features].corr()
         
         print(f"\n📊 Top correlations with Sum:")
         sum_corr = corr_matrix['Sum'].abs().sort_values(ascending=False)
@@ -331,135 +316,140 @@ class AdvancedPatternSummary:
     
     def create_advanced_visualizations(self):
         """Create advanced visualizations for pattern analysis."""
+        # Plotting libraries are only needed here
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from sklearn.decomposition import PCA
+        
         print("\n" + "="*70)
         print("📊 CREATING ADVANCED VISUALIZATIONS")
         print("="*70)
         
         plt.style.use('default')
-        fig = plt.figure(figsize=(20, 15))
+        # Simplify dense line paths when rendering the time series
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        fig, axes = plt.subplots(3, 4, figsize=(20, 15))
+        axes = axes.ravel()
+        
+        # Pull the plotted columns out once as arrays
+        dates = self.df['Draw Date'].to_numpy()
+        sums = self.df['Sum'].to_numpy()
+        clusters = self.df['Cluster'].to_numpy() if 'Cluster' in self.df.columns else None
+        # Moving averages cover full 50-draw windows, so they start at the 50th draw
+        ma_dates = dates[49:]
         
         # 1. Feature correlation heatmap
-        plt.subplot(3, 4, 1)
+        ax = axes[0]
         features = ['Sum', 'Mean', 'Std', 'Range', 'Even_Count', 'Consecutive_Pairs',
                    'Gap_Variance', 'Low_High_Ratio', 'Prime_Count', 'Powerball']
-        corr_matrix = self.df[features].corr()
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0, fmt='.2f')
-        plt.title('Feature Correlation Matrix')
+        corr_matrix = self._corr if self._corr is not None else self.df[features].corr()
+        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0, fmt='.2f', ax=ax)
+        ax.set_title('Feature Correlation Matrix')
         
         # 2. Clustering visualization (PCA)
-        plt.subplot(3, 4, 2)
-        if 'Cluster' in self.df.columns:
+        ax = axes[1]
+        if clusters is not None:
+            # Reuse the standardized clustering matrix
             pca = PCA(n_components=2)
-            X_pca = pca.fit_transform(self.df[features].fillna(0))
-            scatter = plt.scatter(X_pca[:, 0], X_pca[:, 1], c=self.df['Cluster'], cmap='viridis', alpha=0.6)
-            plt.colorbar(scatter)
-            plt.title('Clustering Visualization (PCA)')
-            plt.xlabel(f'PC1 ({pca.explained_variance_ratio_[0]:.1%})')
-            plt.ylabel(f'PC2 ({pca.explained_variance_ratio_[1]:.1%})')
+            X_pca = pca.fit_transform(self._X_scaled)
+            scatter = ax.scatter(X_pca[:, 0], X_pca[:, 1], c=clusters, cmap='viridis', alpha=0.6)
+            fig.colorbar(scatter, ax=ax)
+            ax.set_title('Clustering Visualization (PCA)')
+            ax.set_xlabel(f'PC1 ({pca.explained_variance_ratio_[0]:.1%})')
+            ax.set_ylabel(f'PC2 ({pca.explained_variance_ratio_[1]:.1%})')
         
         # 3. Temporal trends
-        plt.subplot(3, 4, 3)
-        self.df['Sum_MA_50'] = self.df['Sum'].rolling(window=50).mean()
-        plt.plot(self.df['Draw Date'], self.df['Sum'], alpha=0.3, linewidth=0.5)
-        plt.plot(self.df['Draw Date'], self.df['Sum_MA_50'], linewidth=2, color='red')
-        plt.title('Sum Trends Over Time (50-draw MA)')
-        plt.xlabel('Date')
-        plt.ylabel('Sum')
-        plt.xticks(rotation=45)
+        ax = axes[2]
+        ax.plot(dates, sums, alpha=0.3, linewidth=0.5)
+        ax.plot(ma_dates, moving_average(sums), linewidth=2, color='red')
+        ax.set_title('Sum Trends Over Time (50-draw MA)')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Sum')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # 4. Gap distribution
-        plt.subplot(3, 4, 4)
-        all_gaps = []
-        for _, row in self.df.iterrows():
-            sorted_nums = sorted(row['White Balls'])
-            gaps = [sorted_nums[i+1] - sorted_nums[i] for i in range(len(sorted_nums) - 1)]
-            all_gaps.extend(gaps)
-        
-        plt.hist(all_gaps, bins=20, alpha=0.7, edgecolor='black')
-        plt.title('Distribution of Gaps Between Numbers')
-        plt.xlabel('Gap Size')
-        plt.ylabel('Frequency')
-        
-        # 5. Day of week patterns
-        plt.subplot(3, 4, 5)
-        dow_means = self.df.groupby('Day_of_Week')['Sum'].mean()
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        # Only plot days that exist in the data
-        existing_days = [days[i] for i in dow_means.index if i < len(days)]
-        existing_values = [dow_means.iloc[i] for i in dow_means.index if i < len(days)]
-        plt.bar(existing_days, existing_values, alpha=0.7)
-        plt.title('Average Sum by Day of Week')
-        plt.ylabel('Average Sum')
-        
-        # 6. Monthly patterns
-        plt.subplot(3, 4, 6)
-        monthly_means = self.df.groupby('Month')['Sum'].mean()
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        # Only plot months that exist in the data
-        existing_months = [months[i-1] for i in monthly_means.index if 1 <= i <= 12]
-        existing_month_values = [monthly_means.iloc[i] for i in monthly_means.index if 1 <= i <= 12]
-        plt.bar(existing_months, existing_month_values, alpha=0.7)
-        plt.title('Average Sum by Month')
-        plt.ylabel('Average Sum')
-        plt.xticks(rotation=45)
+        ax = axes[3]
+        ax.hist(self._all_gaps, bins=20, alpha=0.7, edgecolor='black')
+        ax.set_title('Distribution of Gaps Between Numbers')
+        ax.set_xlabel('Gap Size')
+        ax.set_ylabel('Frequency')
+        
+        # 5. Day of week patterns (only days that exist in the data)
+        ax = axes[4]
+        dow_means, dow_counts = group_means(self.df['Day_of_Week'].to_numpy(), sums, 7)
+        days = np.array(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+        drawn_days = np.flatnonzero(dow_counts)
+        ax.bar(days[drawn_days], dow_means[drawn_days], alpha=0.7)
+        ax.set_title('Average Sum by Day of Week')
+        ax.set_ylabel('Average Sum')
+        
+        # 6. Monthly patterns (only months that exist in the data)
+        ax = axes[5]
+        month_means, month_counts = group_means(self.df['Month'].to_numpy(), sums, 13)
+        months = np.array(['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+        drawn_months = np.flatnonzero(month_counts)
+        ax.bar(months[drawn_months], month_means[drawn_months], alpha=0.7)
+        ax.set_title('Average Sum by Month')
+        ax.set_ylabel('Average Sum')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # 7. Even/Odd distribution over time
-        plt.subplot(3, 4, 7)
-        even_ma = self.df['Even_Count'].rolling(window=50).mean()
-        plt.plot(self.df['Draw Date'], even_ma, linewidth=2)
-        plt.title('Even Count Trend (50-draw MA)')
-        plt.xlabel('Date')
-        plt.ylabel('Average Even Count')
-        plt.xticks(rotation=45)
+        ax = axes[6]
+        ax.plot(ma_dates, moving_average(self.df['Even_Count'].to_numpy()), linewidth=2)
+        ax.set_title('Even Count Trend (50-draw MA)')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Average Even Count')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # 8. Consecutive pairs over time
-        plt.subplot(3, 4, 8)
-        cons_ma = self.df['Consecutive_Pairs'].rolling(window=50).mean()
-        plt.plot(self.df['Draw Date'], cons_ma, linewidth=2, color='green')
-        plt.title('Consecutive Pairs Trend (50-draw MA)')
-        plt.xlabel('Date')
-        plt.ylabel('Average Consecutive Pairs')
-        plt.xticks(rotation=45)
+        ax = axes[7]
+        ax.plot(ma_dates, moving_average(self.df['Consecutive_Pairs'].to_numpy()), linewidth=2, color='green')
+        ax.set_title('Consecutive Pairs Trend (50-draw MA)')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Average Consecutive Pairs')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # 9. Prime number frequency
-        plt.subplot(3, 4, 9)
-        prime_freq = self.df['Prime_Count'].value_counts().sort_index()
-        plt.bar(prime_freq.index, prime_freq.values, alpha=0.7)
-        plt.title('Distribution of Prime Numbers per Draw')
-        plt.xlabel('Number of Primes')
-        plt.ylabel('Frequency')
+        ax = axes[8]
+        prime_freq = np.bincount(self.df['Prime_Count'].to_numpy())
+        prime_counts = np.flatnonzero(prime_freq)
+        ax.bar(prime_counts, prime_freq[prime_counts], alpha=0.7)
+        ax.set_title('Distribution of Prime Numbers per Draw')
+        ax.set_xlabel('Number of Primes')
+        ax.set_ylabel('Frequency')
         
         # 10. Fibonacci number frequency
-        plt.subplot(3, 4, 10)
-        fib_freq = self.df['Fibonacci_Count'].value_counts().sort_index()
-        plt.bar(fib_freq.index, fib_freq.values, alpha=0.7, color='orange')
-        plt.title('Distribution of Fibonacci Numbers per Draw')
-        plt.xlabel('Number of Fibonacci Numbers')
-        plt.ylabel('Frequency')
+        ax = axes[9]
+        fib_freq = np.bincount(self.df['Fibonacci_Count'].to_numpy())
+        fib_counts = np.flatnonzero(fib_freq)
+        ax.bar(fib_counts, fib_freq[fib_counts], alpha=0.7, color='orange')
+        ax.set_title('Distribution of Fibonacci Numbers per Draw')
+        ax.set_xlabel('Number of Fibonacci Numbers')
+        ax.set_ylabel('Frequency')
         
         # 11. Low/High ratio distribution
-        plt.subplot(3, 4, 11)
-        plt.hist(self.df['Low_High_Ratio'], bins=20, alpha=0.7, edgecolor='black')
-        plt.title('Low/High Number Ratio Distribution')
-        plt.xlabel('Low/High Ratio')
-        plt.ylabel('Frequency')
+        ax = axes[10]
+        ax.hist(self.df['Low_High_Ratio'].to_numpy(), bins=20, alpha=0.7, edgecolor='black')
+        ax.set_title('Low/High Number Ratio Distribution')
+        ax.set_xlabel('Low/High Ratio')
+        ax.set_ylabel('Frequency')
         
         # 12. Sum distribution by cluster
-        plt.subplot(3, 4, 12)
-        if 'Cluster' in self.df.columns:
-            for cluster_id in sorted(self.df['Cluster'].unique()):
-                cluster_data = self.df[self.df['Cluster'] == cluster_id]['Sum']
-                plt.hist(cluster_data, alpha=0.5, label=f'Cluster {cluster_id}', bins=15)
-            plt.title('Sum Distribution by Cluster')
-            plt.xlabel('Sum')
-            plt.ylabel('Frequency')
-            plt.legend()
+        ax = axes[11]
+        if clusters is not None:
+            for cluster_id in np.unique(clusters):
+                ax.hist(sums[clusters == cluster_id], alpha=0.5, label=f'Cluster {cluster_id}', bins=15)
+            ax.set_title('Sum Distribution by Cluster')
+            ax.set_xlabel('Sum')
+            ax.set_ylabel('Frequency')
+            ax.legend()
         
         plt.tight_layout()
-        plt.savefig('advanced_pattern_summary.png', dpi=300, bbox_inches='tight')
+        fig.savefig('advanced_pattern_summary.png', dpi=300, bbox_inches='tight')
         print("Advanced visualizations saved as 'advanced_pattern_summary.png'")
-        plt.show()
+        # Free the figure instead of showing it, so batch and headless runs never block
+        plt.close(fig)
     
     def run_advanced_analysis(self):
         """Run the complete advanced pattern analysis."""
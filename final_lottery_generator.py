@@ -4,165 +4,181 @@ Final Lottery Number Generator
 The most sophisticated lottery number generator using ALL advanced pattern analysis.
 """
 
-import pandas as pd
 import numpy as np
-import random
-from collections import Counter
+from lottery_stats import LotteryStats, extreme_tuples, most_common, z_score_extremes
 import warnings
 warnings.filterwarnings('ignore')
 
+def sample_weighted_batch(rng, p_white, p_pb, n_sets):
+    """Draw n_sets frequency-weighted tickets as an (n_sets, 6) int8 array."""
+    # Weighted sampling without replacement via exponential keys (top 5 of log(u) / p)
+    keys = np.log(rng.random((n_sets, p_white.size))) / p_white
+    picks = np.argpartition(keys, -5, axis=1)[:, -5:] + 1
+    
+    # Powerball by inverting the cumulative distribution
+    cdf = np.cumsum(p_pb)
+    cdf[-1] = 1.0
+    
+    out = np.empty((n_sets, 6), dtype=np.int8)
+    out[:, :5] = np.sort(picks, axis=1)
+    out[:, 5] = np.searchsorted(cdf, rng.random(n_sets), side='right') + 1
+    return out
+
 class FinalLotteryGenerator:
-    def __init__(self, csv_file):
-        """Initialize the final generator with lottery data."""
+    # Position preferences from our analysis, one row per sorted position
+    _pos_pref = np.array([
+        [1, 2, 3, 5, 4],       # 1st position (lowest)
+        [12, 21, 28, 16, 15],  # 2nd position
+        [37, 33, 35, 34, 32],  # 3rd position (middle)
+        [52, 53, 45, 47, 39],  # 4th position
+        [69, 59, 58, 67, 68]   # 5th position (highest)
+    ], dtype=np.int8)
+    
+    def __init__(self, csv_file, stats=None):
+        """Initialize the final generator, optionally reusing precomputed LotteryStats."""
         self.csv_file = csv_file
-        self.df = None
-        self.white_balls = []
-        self.powerballs = []
+        self.stats = stats
         self.hot_numbers = []
         self.cold_numbers = []
+        self.rng = np.random.default_rng()
         self.load_data()
         self.analyze_all_patterns()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data for final generation...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
+        # Parse winning numbers and frequencies once; shared with the heat rankings
+        if self.stats is None:
+            self.stats = LotteryStats.from_csv(self.csv_file)
+        self.white_arr = self.stats.white_arr
+        self.pb_arr = self.stats.pb_arr
         
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
-        
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
-        
-        print(f"Loaded {len(self.df)} lottery draws")
+        print(f"Loaded {self.pb_arr.size} lottery draws")
     
     def analyze_all_patterns(self):
         """Analyze ALL patterns from our advanced analysis."""
         print("Analyzing ALL patterns for final generation...")
         
-        # Calculate frequencies
-        white_freq = Counter(self.white_balls)
-        pb_freq = Counter(self.powerballs)
-        
-        # Calculate expected frequencies
-        expected_white = len(self.white_balls) / 69
-        expected_pb = len(self.powerballs) / 26
-        
-        # Identify hot and cold numbers using Z-scores
-        self.hot_numbers = []
-        self.cold_numbers = []
-        
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_white) / np.sqrt(expected_white)
-            if z_score > 2:  # Hot numbers
-                self.hot_numbers.append((num, z_score, observed_count))
-            elif z_score < -2:  # Cold numbers
-                self.cold_numbers.append((num, z_score, observed_count))
-        
-        # Sort by Z-score
-        self.hot_numbers.sort(key=lambda x: x[1], reverse=True)
-        self.cold_numbers.sort(key=lambda x: x[1])
-        
-        # Store frequency data
-        self.white_freq = white_freq
-        self.pb_freq = pb_freq
+        # Frequencies
+        self.white_counts = self.stats.white_counts
+        self.pb_counts = self.stats.pb_counts
+        
+        # Identify hot and cold numbers using Z-scores, sorted by Z-score
+        hot, cold = z_score_extremes(self.stats.z_white, self.white_counts, 2)
+        self.hot_numbers = extreme_tuples(*hot)
+        self.cold_numbers = extreme_tuples(*cold)
+        self.hot_nums_list = hot[0].tolist()
+        self.cold_nums_list = cold[0].tolist()
+        self.hot_set = frozenset(self.hot_nums_list)
+        
+        # Per-number label: +1 hot, -1 cold, 0 neutral
+        self.label = np.zeros(70, dtype=np.int8)
+        self.label[hot[0]] = 1
+        self.label[cold[0]] = -1
+        
+        # Hot numbers among each position's preferences
+        self._hot_in_pos = [[num for num in row if num in self.hot_set] for row in self._pos_pref.tolist()]
+        
+        # Selection probabilities for frequency weighting (one pool ticket per 10 / 5 draws)
+        white_weights = np.maximum(1, self.white_counts[1:] // 10).astype(np.float64)
+        pb_weights = np.maximum(1, self.pb_counts[1:27] // 5).astype(np.float64)
+        self.p_white = white_weights / white_weights.sum()
+        self.p_pb = pb_weights / pb_weights.sum()
+        
+        # Rank drawn numbers from most to least frequent (Counter.most_common order)
+        self.white_rank = most_common(self.white_arr, self.white_counts)
+        self.pb_rank = most_common(self.pb_arr, self.pb_counts)
+        
+        # Cache most/least frequent pools used by the strategies
+        self.top_whites = self.white_rank[:20].tolist()
+        self.bot_whites = self.white_rank[-20:].tolist()
+        self.top_pbs = self.pb_rank[:10].tolist()
+        self.bot_pbs = self.pb_rank[-10:].tolist()
         
         print(f"Found {len(self.hot_numbers)} hot numbers and {len(self.cold_numbers)} cold numbers")
     
+    def pick(self, pool):
+        """Pick one element of pool uniformly at random."""
+        return pool[self.rng.integers(len(pool))]
+    
+    def pick_many(self, pool, k):
+        """Pick k distinct elements of pool uniformly at random."""
+        return [pool[i] for i in self.rng.choice(len(pool), k, replace=False)]
+    
     def generate_ultimate_hot_strategy(self):
         """Generate numbers using ultimate hot strategy."""
-        print("\n🔥 ULTIMATE HOT STRATEGY")
-        print("="*40)
-        
         white_balls = []
         
         # Use ALL hot numbers if we have them, otherwise use as many as possible
         hot_count = min(4, len(self.hot_numbers))
         if hot_count > 0:
-            hot_selected = random.sample([num for num, _, _ in self.hot_numbers], hot_count)
+            hot_selected = self.pick_many(self.hot_nums_list, hot_count)
             white_balls.extend(hot_selected)
         
         # Fill remaining with most frequent numbers
         remaining = 5 - len(white_balls)
         if remaining > 0:
-            most_frequent = [num for num, count in self.white_freq.most_common(20)]
-            available_frequent = [num for num in most_frequent if num not in white_balls]
+            available_frequent = [num for num in self.top_whites if num not in white_balls]
             if available_frequent:
-                white_balls.extend(random.sample(available_frequent, min(remaining, len(available_frequent))))
+                white_balls.extend(self.pick_many(available_frequent, min(remaining, len(available_frequent))))
         
         # Fill any remaining with random
         while len(white_balls) < 5:
             all_numbers = list(range(1, 70))
             available = [num for num in all_numbers if num not in white_balls]
-            white_balls.append(random.choice(available))
+            white_balls.append(self.pick(available))
         
         # Generate powerball using most frequent
-        most_common_pbs = [num for num, count in self.pb_freq.most_common(10)]
-        powerball = random.choice(most_common_pbs)
+        powerball = self.pick(self.top_pbs)
         
         return sorted(white_balls), powerball
     
     def generate_ultimate_cold_strategy(self):
         """Generate numbers using ultimate cold strategy."""
-        print("\n❄️  ULTIMATE COLD STRATEGY")
-        print("="*40)
-        
         white_balls = []
         
         # Use ALL cold numbers if we have them, otherwise use as many as possible
         cold_count = min(4, len(self.cold_numbers))
         if cold_count > 0:
-            cold_selected = random.sample([num for num, _, _ in self.cold_numbers], cold_count)
+            cold_selected = self.pick_many(self.cold_nums_list, cold_count)
             white_balls.extend(cold_selected)
         
         # Fill remaining with least frequent numbers
         remaining = 5 - len(white_balls)
         if remaining > 0:
-            least_frequent = [num for num, count in self.white_freq.most_common()[-20:]]
-            available_least = [num for num in least_frequent if num not in white_balls]
+            available_least = [num for num in self.bot_whites if num not in white_balls]
             if available_least:
-                white_balls.extend(random.sample(available_least, min(remaining, len(available_least))))
+                white_balls.extend(self.pick_many(available_least, min(remaining, len(available_least))))
         
         # Fill any remaining with random
         while len(white_balls) < 5:
             all_numbers = list(range(1, 70))
             available = [num for num in all_numbers if num not in white_balls]
-            white_balls.append(random.choice(available))
+            white_balls.append(self.pick(available))
         
         # Generate powerball using least frequent
-        least_frequent_pbs = [num for num, count in self.pb_freq.most_common()[-10:]]
-        powerball = random.choice(least_frequent_pbs)
+        powerball = self.pick(self.bot_pbs)
         
         return sorted(white_balls), powerball
     
     def generate_ultimate_balanced_strategy(self):
         """Generate numbers using ultimate balanced strategy."""
-        print("\n⚖️  ULTIMATE BALANCED STRATEGY")
-        print("="*40)
-        
         white_balls = []
         
         # Select 2 hot numbers if available
         if len(self.hot_numbers) >= 2:
-            hot_selected = random.sample([num for num, _, _ in self.hot_numbers], 2)
+            hot_selected = self.pick_many(self.hot_nums_list, 2)
             white_balls.extend(hot_selected)
         elif len(self.hot_numbers) > 0:
-            hot_selected = [num for num, _, _ in self.hot_numbers]
+            hot_selected = self.hot_nums_list
             white_balls.extend(hot_selected)
         
         # Select 2 cold numbers if available
         if len(self.cold_numbers) >= 2:
-            cold_selected = random.sample([num for num, _, _ in self.cold_numbers], 2)
+            cold_selected = self.pick_many(self.cold_nums_list, 2)
             white_balls.extend(cold_selected)
         elif len(self.cold_numbers) > 0:
-            cold_selected = [num for num, _, _ in self.cold_numbers]
+            cold_selected = self.cold_nums_list
             white_balls.extend(cold_selected)
         
         # Fill remaining with random
@@ -170,101 +186,60 @@ class FinalLotteryGenerator:
         if remaining > 0:
             all_numbers = list(range(1, 70))
             available = [num for num in all_numbers if num not in white_balls]
-            white_balls.extend(random.sample(available, remaining))
+            white_balls.extend(self.pick_many(available, remaining))
         
         # Generate powerball (balanced)
-        if random.random() < 0.6:  # 60% chance for frequent
-            most_common_pbs = [num for num, count in self.pb_freq.most_common(10)]
-            powerball = random.choice(most_common_pbs)
+        if self.rng.random() < 0.6:  # 60% chance for frequent
+            powerball = self.pick(self.top_pbs)
         else:  # 40% chance for less frequent
-            least_frequent_pbs = [num for num, count in self.pb_freq.most_common()[-10:]]
-            powerball = random.choice(least_frequent_pbs)
+            powerball = self.pick(self.bot_pbs)
         
         return sorted(white_balls), powerball
     
     def generate_frequency_weighted_strategy(self):
         """Generate numbers using frequency-weighted selection."""
-        print("\n📊 FREQUENCY-WEIGHTED STRATEGY")
-        print("="*40)
-        
-        # Create weighted selection pool based on actual frequencies
-        selection_pool = []
-        
-        for num in range(1, 70):
-            count = self.white_freq.get(num, 0)
-            # Weight by actual frequency
-            weight = max(1, count // 10)
-            selection_pool.extend([num] * weight)
-        
-        # Generate 5 unique numbers
-        white_balls = []
-        while len(white_balls) < 5:
-            num = random.choice(selection_pool)
-            if num not in white_balls:
-                white_balls.append(num)
-        
-        # Generate powerball using frequency weighting
-        pb_pool = []
-        for num in range(1, 27):
-            count = self.pb_freq.get(num, 0)
-            weight = max(1, count // 5)
-            pb_pool.extend([num] * weight)
-        
-        powerball = random.choice(pb_pool)
-        
-        return sorted(white_balls), powerball
+        draw = self.generate_frequency_weighted_batch(1)[0].tolist()
+        return draw[:5], draw[5]
+    
+    def generate_frequency_weighted_batch(self, n_sets):
+        """Generate n_sets frequency-weighted draws as an (n_sets, 6) array in one pass."""
+        return sample_weighted_batch(self.rng, self.p_white, self.p_pb, n_sets)
     
     def generate_position_based_strategy(self):
         """Generate numbers using position-based strategy."""
-        print("\n🎯 POSITION-BASED STRATEGY")
-        print("="*40)
-        
-        # Position preferences from our analysis
-        position_preferences = {
-            0: [1, 2, 3, 5, 4],  # 1st position (lowest)
-            1: [12, 21, 28, 16, 15],  # 2nd position
-            2: [37, 33, 35, 34, 32],  # 3rd position (middle)
-            3: [52, 53, 45, 47, 39],  # 4th position
-            4: [69, 59, 58, 67, 68]   # 5th position (highest)
-        }
-        
         white_balls = []
+        mask = 0  # bit n set once number n is taken
         
         # Select one number from each position preference
         for pos in range(5):
-            preferred_nums = position_preferences[pos]
-            
             # Weight towards hot numbers in this position
-            hot_in_position = [num for num in preferred_nums if num in [hot[0] for hot in self.hot_numbers]]
+            hot_in_position = self._hot_in_pos[pos]
             
-            if hot_in_position and random.random() < 0.8:  # 80% chance for hot
-                selected = random.choice(hot_in_position)
+            if hot_in_position and self.rng.random() < 0.8:  # 80% chance for hot
+                selected = self.pick(hot_in_position)
             else:
-                selected = random.choice(preferred_nums)
+                selected = int(self.pick(self._pos_pref[pos]))
             
-            white_balls.append(selected)
+            # Drop repeats; they are refilled below
+            if not (mask >> selected) & 1:
+                mask |= 1 << selected
+                white_balls.append(selected)
         
         # Ensure uniqueness
-        while len(set(white_balls)) < 5:
-            white_balls = list(set(white_balls))
-            remaining = 5 - len(white_balls)
-            all_numbers = list(range(1, 70))
-            available = [num for num in all_numbers if num not in white_balls]
-            white_balls.extend(random.sample(available, remaining))
+        remaining = 5 - len(white_balls)
+        if remaining > 0:
+            available = [num for num in range(1, 70) if not (mask >> num) & 1]
+            white_balls.extend(self.pick_many(available, remaining))
         
         # Generate powerball using most frequent
-        most_common_pbs = [num for num, count in self.pb_freq.most_common(10)]
-        powerball = random.choice(most_common_pbs)
+        powerball = self.pick(self.top_pbs)
         
         return sorted(white_balls), powerball
     
     def generate_random_strategy(self):
         """Generate completely random numbers."""
-        print("\n🎲 RANDOM STRATEGY")
-        print("="*40)
-        
-        white_balls = sorted(random.sample(range(1, 70), 5))
-        powerball = random.randint(1, 26)
+        white_balls = sorted(self.pick_many(range(1, 70), 5))
+        powerball = int(self.rng.integers(1, 27))
         
         return white_balls, powerball
     
@@ -275,15 +250,17 @@ class FinalLotteryGenerator:
         print(f"Powerball: {powerball:02d}")
         
         # Detailed analysis
-        hot_count = sum(1 for num in white_balls if num in [hot[0] for hot in self.hot_numbers])
-        cold_count = sum(1 for num in white_balls if num in [cold[0] for cold in self.cold_numbers])
+        wb = np.asarray(white_balls, dtype=np.int8)
+        labels = self.label[wb]
+        hot_count = int(np.count_nonzero(labels > 0))
+        cold_count = int(np.count_nonzero(labels < 0))
         neutral_count = 5 - hot_count - cold_count
         
         print(f"Analysis: {hot_count} hot, {cold_count} cold, {neutral_count} neutral")
         
         # Calculate sum and other stats
-        total_sum = sum(white_balls)
-        even_count = sum(1 for num in white_balls if num % 2 == 0)
+        total_sum = int(wb.sum())
+        even_count = int(np.count_nonzero((wb & 1) == 0))
         print(f"Sum: {total_sum}, Even count: {even_count}")
         
         return white_balls, powerball
@@ -296,20 +273,25 @@ class FinalLotteryGenerator:
         print("="*60)
         
         strategies = [
-            ("Ultimate Hot", self.generate_ultimate_hot_strategy),
-            ("Ultimate Cold", self.generate_ultimate_cold_strategy),
-            ("Ultimate Balanced", self.generate_ultimate_balanced_strategy),
-            ("Frequency-Weighted", self.generate_frequency_weighted_strategy),
-            ("Position-Based", self.generate_position_based_strategy),
-            ("Random", self.generate_random_strategy)
+            ("Ultimate Hot", "🔥 ULTIMATE HOT STRATEGY", self.generate_ultimate_hot_strategy),
+            ("Ultimate Cold", "❄️  ULTIMATE COLD STRATEGY", self.generate_ultimate_cold_strategy),
+            ("Ultimate Balanced", "⚖️  ULTIMATE BALANCED STRATEGY", self.generate_ultimate_balanced_strategy),
+            ("Frequency-Weighted", "📊 FREQUENCY-WEIGHTED STRATEGY", self.generate_frequency_weighted_strategy),
+            ("Position-Based", "🎯 POSITION-BASED STRATEGY", self.generate_position_based_strategy),
+            ("Random", "🎲 RANDOM STRATEGY", self.generate_random_strategy)
         ]
         
+        # Generate every set first; the strategies themselves have no output
         generated_sets = []
-        
         for i in range(num_sets):
-            strategy_name, generator_func = strategies[i % len(strategies)]
+            strategy_name, _, generator_func = strategies[i % len(strategies)]
             white_balls, powerball = generator_func()
             generated_sets.append((white_balls, powerball, strategy_name))
+        
+        # Display pass
+        for i, (white_balls, powerball, strategy_name) in enumerate(generated_sets):
+            print(f"\n{strategies[i % len(strategies)][1]}")
+            print("="*40)
             self.display_numbers(white_balls, powerball, strategy_name)
         
         return generated_sets
@@ -329,8 +311,9 @@ class FinalLotteryGenerator:
             print(f"   {i:2d}. Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
         
         print(f"\n🎯 POWERBALL ANALYSIS:")
-        print(f"   Most frequent: {self.pb_freq.most_common(1)[0][0]} ({self.pb_freq.most_common(1)[0][1]} times)")
-        print(f"   Least frequent: {self.pb_freq.most_common()[-1][0]} ({self.pb_freq.most_common()[-1][1]} times)")
+        most, least = self.pb_rank[0], self.pb_rank[-1]
+        print(f"   Most frequent: {most} ({self.pb_counts[most]} times)")
+        print(f"   Least frequent: {least} ({self.pb_counts[least]} times)")
 
 def main():
     """Main function to run the final lottery generator."""
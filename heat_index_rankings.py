@@ -4,148 +4,87 @@ Lottery Number Heat Index Rankings
 Comprehensive ranking of all lottery numbers by their "heat index" based on statistical analysis.
 """
 
+import sys
 import pandas as pd
 import numpy as np
-from collections import Counter
+from lottery_stats import LotteryStats
 import warnings
 warnings.filterwarnings('ignore')
 
+# Heat categories from coldest to hottest, split at these Z-score edges (lower edge inclusive)
+HEAT_EDGES = np.array([-2, -1, -0.5, 0.5, 1, 2])
+HEAT_CATEGORIES = np.array(["🧊 FREEZING", "❄️ COLD", "❄️ COOL", "🌡️ NEUTRAL", "🌡️ WARM", "🔥 HOT", "🔥 BLAZING HOT"])
+
 class HeatIndexRankings:
-    def __init__(self, csv_file):
-        """Initialize the heat index analyzer."""
+    def __init__(self, csv_file, stats=None):
+        """Initialize the heat index analyzer, optionally reusing precomputed LotteryStats."""
         self.csv_file = csv_file
-        self.df = None
-        self.white_balls = []
-        self.powerballs = []
+        self.stats = stats
         self.load_data()
         self.calculate_heat_index()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data for heat index analysis...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
-        
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
-        
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
+        # Parse winning numbers and frequencies once; shared with the generators
+        if self.stats is None:
+            self.stats = LotteryStats.from_csv(self.csv_file)
+        self.white_arr = self.stats.white_arr
+        self.pb_arr = self.stats.pb_arr
         
-        print(f"Loaded {len(self.df)} lottery draws")
+        print(f"Loaded {self.pb_arr.size} lottery draws")
     
     def calculate_heat_index(self):
         """Calculate comprehensive heat index for all numbers."""
         print("Calculating heat index rankings...")
         
-        # Calculate frequencies
-        white_freq = Counter(self.white_balls)
-        pb_freq = Counter(self.powerballs)
-        
-        # Calculate expected frequencies
-        expected_white = len(self.white_balls) / 69
-        expected_pb = len(self.powerballs) / 26
-        
-        # Calculate Z-scores for white balls
-        self.white_heat_data = []
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_white) / np.sqrt(expected_white)
-            
-            # Calculate additional metrics
-            frequency = observed_count
-            percentage = (observed_count / len(self.white_balls)) * 100
-            deviation = observed_count - expected_white
-            
-            # Create heat index (0-100 scale)
-            # Z-score of +3 = 100, Z-score of -3 = 0, Z-score of 0 = 50
-            heat_index = max(0, min(100, 50 + (z_score * 16.67)))
-            
-            self.white_heat_data.append({
-                'number': num,
-                'frequency': frequency,
-                'expected': expected_white,
-                'deviation': deviation,
-                'percentage': percentage,
-                'z_score': z_score,
-                'heat_index': heat_index,
-                'category': self.get_heat_category(z_score)
-            })
-        
-        # Calculate Z-scores for powerballs
-        self.pb_heat_data = []
-        for num in range(1, 27):
-            observed_count = pb_freq.get(num, 0)
-            z_score = (observed_count - expected_pb) / np.sqrt(expected_pb)
-            
-            # Calculate additional metrics
-            frequency = observed_count
-            percentage = (observed_count / len(self.powerballs)) * 100
-            deviation = observed_count - expected_pb
-            
-            # Create heat index (0-100 scale)
-            heat_index = max(0, min(100, 50 + (z_score * 16.67)))
-            
-            self.pb_heat_data.append({
-                'number': num,
-                'frequency': frequency,
-                'expected': expected_pb,
-                'deviation': deviation,
-                'percentage': percentage,
-                'z_score': z_score,
-                'heat_index': heat_index,
-                'category': self.get_heat_category(z_score)
-            })
+        stats = self.stats
+        self.white_df = self.build_heat_table(stats.white_counts[1:], stats.expected_white,
+                                              stats.z_white, stats.heat_white, self.white_arr.size)
+        self.pb_df = self.build_heat_table(stats.pb_counts[1:27], stats.expected_pb,
+                                           stats.z_pb, stats.heat_pb, self.pb_arr.size)
+    
+    def build_heat_table(self, counts, expected, z, heat, total):
+        """Build the heat index table for numbers 1..len(counts), hottest first."""
+        category = HEAT_CATEGORIES[np.searchsorted(HEAT_EDGES, z, side='right')]
+        
+        table = pd.DataFrame({
+            'number': np.arange(1, len(counts) + 1),
+            'frequency': counts,
+            'expected': expected,
+            'deviation': counts - expected,
+            'percentage': (counts / np.float32(total)) * 100,
+            'z_score': z,
+            'heat_index': heat,
+            'category': category
+        })
         
         # Sort by heat index (descending)
-        self.white_heat_data.sort(key=lambda x: x['heat_index'], reverse=True)
-        self.pb_heat_data.sort(key=lambda x: x['heat_index'], reverse=True)
+        return table.sort_values('heat_index', ascending=False, kind='stable', ignore_index=True)
     
-    def get_heat_category(self, z_score):
-        """Categorize numbers based on Z-score."""
-        if z_score >= 2:
-            return "🔥 BLAZING HOT"
-        elif z_score >= 1:
-            return "🔥 HOT"
-        elif z_score >= 0.5:
-            return "🌡️ WARM"
-        elif z_score >= -0.5:
-            return "🌡️ NEUTRAL"
-        elif z_score >= -1:
-            return "❄️ COOL"
-        elif z_score >= -2:
-            return "❄️ COLD"
-        else:
-            return "🧊 FREEZING"
+    def format_rankings(self, title, table):
+        """Format a full ranking table as a single string."""
+        lines = [
+            "\n" + "="*80,
+            title,
+            "="*80,
+            f"{'Rank':<4} {'Number':<6} {'Heat Index':<10} {'Category':<15} {'Freq':<5} {'Z-Score':<8} {'%':<6}",
+            "-" * 80,
+        ]
+        lines.extend(
+            f"{i:<4} {data.number:<6} {data.heat_index:<10.1f} {data.category:<15} "
+            f"{data.frequency:<5} {data.z_score:<8.2f} {data.percentage:<6.2f}"
+            for i, data in enumerate(table.itertuples(index=False), 1)
+        )
+        return "\n".join(lines) + "\n"
     
     def display_white_ball_rankings(self):
         """Display comprehensive white ball heat index rankings."""
-        print("\n" + "="*80)
-        print("🔥 WHITE BALL HEAT INDEX RANKINGS (1-69)")
-        print("="*80)
-        print(f"{'Rank':<4} {'Number':<6} {'Heat Index':<10} {'Category':<15} {'Freq':<5} {'Z-Score':<8} {'%':<6}")
-        print("-" * 80)
-        
-        for i, data in enumerate(self.white_heat_data, 1):
-            print(f"{i:<4} {data['number']:<6} {data['heat_index']:<10.1f} {data['category']:<15} "
-                  f"{data['frequency']:<5} {data['z_score']:<8.2f} {data['percentage']:<6.2f}")
+        sys.stdout.write(self.format_rankings("🔥 WHITE BALL HEAT INDEX RANKINGS (1-69)", self.white_df))
     
     def display_powerball_rankings(self):
         """Display comprehensive powerball heat index rankings."""
-        print("\n" + "="*80)
-        print("🎯 POWERBALL HEAT INDEX RANKINGS (1-26)")
-        print("="*80)
-        print(f"{'Rank':<4} {'Number':<6} {'Heat Index':<10} {'Category':<15} {'Freq':<5} {'Z-Score':<8} {'%':<6}")
-        print("-" * 80)
-        
-        for i, data in enumerate(self.pb_heat_data, 1):
-            print(f"{i:<4} {data['number']:<6} {data['heat_index']:<10.1f} {data['category']:<15} "
-                  f"{data['frequency']:<5} {data['z_score']:<8.2f} {data['percentage']:<6.2f}")
+        sys.stdout.write(self.format_rankings("🎯 POWERBALL HEAT INDEX RANKINGS (1-26)", self.pb_df))
     
     def display_hot_numbers(self):
         """Display the hottest numbers."""
@@ -153,18 +92,18 @@ class HeatIndexRankings:
         print("🔥 HOTTEST NUMBERS (Heat Index > 70)")
         print("="*60)
         
-        hot_white = [data for data in self.white_heat_data if data['heat_index'] > 70]
-        hot_pb = [data for data in self.pb_heat_data if data['heat_index'] > 70]
+        hot_white = self.white_df[self.white_df['heat_index'] > 70]
+        hot_pb = self.pb_df[self.pb_df['heat_index'] > 70]
         
         print("\nWhite Balls:")
-        for data in hot_white:
-            print(f"   Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times, Z-score {data['z_score']:5.2f})")
+        for data in hot_white.itertuples(index=False):
+            print(f"   Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times, Z-score {data.z_score:5.2f})")
         
         print("\nPowerballs:")
-        for data in hot_pb:
-            print(f"   Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times, Z-score {data['z_score']:5.2f})")
+        for data in hot_pb.itertuples(index=False):
+            print(f"   Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times, Z-score {data.z_score:5.2f})")
     
     def display_cold_numbers(self):
         """Display the coldest numbers."""
@@ -172,18 +111,18 @@ class HeatIndexRankings:
         print("❄️ COLDEST NUMBERS (Heat Index < 30)")
         print("="*60)
         
-        cold_white = [data for data in self.white_heat_data if data['heat_index'] < 30]
-        cold_pb = [data for data in self.pb_heat_data if data['heat_index'] < 30]
+        cold_white = self.white_df[self.white_df['heat_index'] < 30]
+        cold_pb = self.pb_df[self.pb_df['heat_index'] < 30]
         
         print("\nWhite Balls:")
-        for data in cold_white:
-            print(f"   Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times, Z-score {data['z_score']:5.2f})")
+        for data in cold_white.itertuples(index=False):
+            print(f"   Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times, Z-score {data.z_score:5.2f})")
         
         print("\nPowerballs:")
-        for data in cold_pb:
-            print(f"   Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times, Z-score {data['z_score']:5.2f})")
+        for data in cold_pb.itertuples(index=False):
+            print(f"   Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times, Z-score {data.z_score:5.2f})")
     
     def display_category_summary(self):
         """Display summary by heat categories."""
@@ -192,20 +131,14 @@ class HeatIndexRankings:
         print("="*60)
         
         # Count by category for white balls
-        white_categories = {}
-        for data in self.white_heat_data:
-            category = data['category']
-            white_categories[category] = white_categories.get(category, 0) + 1
+        white_categories = self.white_df.groupby('category', sort=False).size()
         
         print("\nWhite Balls by Category:")
         for category, count in white_categories.items():
             print(f"   {category}: {count} numbers")
         
         # Count by category for powerballs
-        pb_categories = {}
-        for data in self.pb_heat_data:
-            category = data['category']
-            pb_categories[category] = pb_categories.get(category, 0) + 1
+        pb_categories = self.pb_df.groupby('category', sort=False).size()
         
         print("\nPowerballs by Category:")
         for category, count in pb_categories.items():
@@ -214,26 +147,26 @@ class HeatIndexRankings:
     def get_top_numbers_by_heat(self, count=10):
         """Get top numbers by heat index."""
         print(f"\n🔥 TOP {count} HOTTEST WHITE BALLS:")
-        for i, data in enumerate(self.white_heat_data[:count], 1):
-            print(f"   {i:2d}. Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times)")
+        for i, data in enumerate(self.white_df.head(count).itertuples(index=False), 1):
+            print(f"   {i:2d}. Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times)")
         
         print(f"\n🎯 TOP {count} HOTTEST POWERBALLS:")
-        for i, data in enumerate(self.pb_heat_data[:count], 1):
-            print(f"   {i:2d}. Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times)")
+        for i, data in enumerate(self.pb_df.head(count).itertuples(index=False), 1):
+            print(f"   {i:2d}. Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times)")
     
     def get_bottom_numbers_by_heat(self, count=10):
         """Get bottom numbers by heat index."""
         print(f"\n❄️ TOP {count} COLDEST WHITE BALLS:")
-        for i, data in enumerate(self.white_heat_data[-count:], 1):
-            print(f"   {i:2d}. Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times)")
+        for i, data in enumerate(self.white_df.tail(count).itertuples(index=False), 1):
+            print(f"   {i:2d}. Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times)")
         
         print(f"\n🧊 TOP {count} COLDEST POWERBALLS:")
-        for i, data in enumerate(self.pb_heat_data[-count:], 1):
-            print(f"   {i:2d}. Number {data['number']:2d}: Heat Index {data['heat_index']:5.1f} "
-                  f"({data['frequency']:3d} times)")
+        for i, data in enumerate(self.pb_df.tail(count).itertuples(index=False), 1):
+            print(f"   {i:2d}. Number {data.number:2d}: Heat Index {data.heat_index:5.1f} "
+                  f"({data.frequency:3d} times)")
     
     def run_complete_analysis(self):
         """Run complete heat index analysis."""
@@ -4,270 +4,190 @@ Intelligent Lottery Number Generator
 Uses advanced pattern analysis to generate "smart" lottery numbers based on historical data.
 """
 
-import pandas as pd
 import numpy as np
-import random
-from collections import Counter
-from datetime import datetime
-import warnings
-warnings.filterwarnings('ignore')
+from lottery_data import load_draws
+from lottery_stats import LotteryStats, z_score_extremes
 
 class IntelligentLotteryGenerator:
+    # Position-based selection (from our analysis), one row per sorted position
+    position_preferences = np.array([
+        [1, 2, 3, 4, 5],       # 1st position (lowest)
+        [12, 21, 28, 16, 15],  # 2nd position
+        [37, 33, 35, 34, 32],  # 3rd position (middle)
+        [52, 53, 45, 47, 39],  # 4th position
+        [69, 59, 58, 67, 68]   # 5th position (highest)
+    ], dtype=np.int8)
+    
     def __init__(self, csv_file):
         """Initialize the generator with lottery data."""
         self.csv_file = csv_file
-        self.df = None
-        self.white_balls = []
-        self.powerballs = []
-        self.hot_numbers = []
-        self.cold_numbers = []
-        self.hot_powerballs = []
-        self.cold_powerballs = []
+        self.rng = np.random.default_rng()
         self.load_data()
         self.analyze_patterns()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data for intelligent generation...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
-        
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
-        
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
+        # Draw dates and the (draws, 6) int8 number matrix in file order; reused from the .npz cache when current
+        dates, _, nums = load_draws(self.csv_file)
+        self.white_arr = nums[:, :5]
+        self.pb_arr = nums[:, 5]
         
-        print(f"Loaded {len(self.df)} lottery draws from {self.df['Draw Date'].min().strftime('%Y-%m-%d')} to {self.df['Draw Date'].max().strftime('%Y-%m-%d')}")
+        print(f"Loaded {len(nums)} lottery draws from {np.datetime_as_string(dates.min(), unit='D')} to {np.datetime_as_string(dates.max(), unit='D')}")
     
     def analyze_patterns(self):
         """Analyze patterns to identify hot/cold numbers and other insights."""
         print("Analyzing patterns for intelligent generation...")
         
-        # Calculate frequencies
-        white_freq = Counter(self.white_balls)
-        pb_freq = Counter(self.powerballs)
-        
-        # Calculate expected frequencies
-        expected_white = len(self.white_balls) / 69
-        expected_pb = len(self.powerballs) / 26
+        # Frequencies and Z-scores in one pass over the arrays
+        self.stats = LotteryStats.from_arrays(self.white_arr.ravel(), self.pb_arr)
+        stats = self.stats
         
         # Identify hot and cold numbers using Z-scores
-        self.hot_numbers = []
-        self.cold_numbers = []
-        
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_white) / np.sqrt(expected_white)
-            if z_score > 2:  # Hot numbers
-                self.hot_numbers.append((num, z_score, observed_count))
-            elif z_score < -2:  # Cold numbers
-                self.cold_numbers.append((num, z_score, observed_count))
-        
-        # Sort by Z-score
-        self.hot_numbers.sort(key=lambda x: x[1], reverse=True)
-        self.cold_numbers.sort(key=lambda x: x[1])
+        ((self.hot_nums, self.hot_z, self.hot_counts),
+         (self.cold_nums, self.cold_z, self.cold_counts)) = z_score_extremes(stats.z_white, stats.white_counts, 2)
         
         # Identify hot and cold powerballs
-        self.hot_powerballs = []
-        self.cold_powerballs = []
-        
-        for num in range(1, 27):
-            observed_count = pb_freq.get(num, 0)
-            z_score = (observed_count - expected_pb) / np.sqrt(expected_pb)
-            if z_score > 1.5:  # Hot powerballs
-                self.hot_powerballs.append((num, z_score, observed_count))
-            elif z_score < -1.5:  # Cold powerballs
-                self.cold_powerballs.append((num, z_score, observed_count))
-        
-        # Sort by Z-score
-        self.hot_powerballs.sort(key=lambda x: x[1], reverse=True)
-        self.cold_powerballs.sort(key=lambda x: x[1])
-        
-        print(f"Identified {len(self.hot_numbers)} hot white balls and {len(self.cold_numbers)} cold white balls")
-        print(f"Identified {len(self.hot_powerballs)} hot powerballs and {len(self.cold_powerballs)} cold powerballs")
+        ((self.hot_pb_nums, self.hot_pb_z, self.hot_pb_counts),
+         (self.cold_pb_nums, self.cold_pb_z, self.cold_pb_counts)) = z_score_extremes(stats.z_pb, stats.pb_counts, 1.5)
+        
+        # Ten most frequent current-range powerballs (1-26), so they index pb_label safely
+        self.top10_pb = np.argpartition(-stats.pb_counts[1:27].astype(np.int32), 10)[:10] + 1
+        
+        # Hot/cold lookup masks indexed by number, and the neutral numbers left over
+        self.is_hot = np.zeros(70, dtype=bool)
+        self.is_cold = np.zeros(70, dtype=bool)
+        self.is_hot_pb = np.zeros(27, dtype=bool)
+        self.is_cold_pb = np.zeros(27, dtype=bool)
+        self.is_hot[self.hot_nums] = True
+        self.is_cold[self.cold_nums] = True
+        self.is_hot_pb[self.hot_pb_nums] = True
+        self.is_cold_pb[self.cold_pb_nums] = True
+        self.neutral_white = np.flatnonzero(~self.is_hot & ~self.is_cold)[1:]
+        self.neutral_pb = np.flatnonzero(~self.is_hot_pb & ~self.is_cold_pb)[1:]
+        
+        # Per-number labels for display: 0 cold, 1 neutral, 2 hot
+        self.label = np.ones(70, dtype=np.int8)
+        self.label[self.hot_nums] = 2
+        self.label[self.cold_nums] = 0
+        self.pb_label = np.ones(27, dtype=np.int8)
+        self.pb_label[self.hot_pb_nums] = 2
+        self.pb_label[self.cold_pb_nums] = 0
+        
+        # Conservative selection weights: hot 70, neutral 4, cold 1 (powerballs: hot 40, neutral 10)
+        weights = np.where(self.is_hot, 70.0, np.where(self.is_cold, 1.0, 4.0))
+        weights[0] = 0
+        self.conservative_p = weights / weights.sum()
+        self.conservative_logp = np.log(self.conservative_p[1:])
+        pb_weights = np.zeros(27)
+        pb_weights[self.neutral_pb] = 10.0
+        pb_weights[self.is_hot_pb] = 40.0
+        self.conservative_pb_p = pb_weights / pb_weights.sum()
+        self.conservative_pb_cdf = np.cumsum(self.conservative_pb_p)
+        
+        print(f"Identified {self.hot_nums.size} hot white balls and {self.cold_nums.size} cold white balls")
+        print(f"Identified {self.hot_pb_nums.size} hot powerballs and {self.cold_pb_nums.size} cold powerballs")
     
     def generate_conservative_numbers(self):
         """Generate numbers using conservative approach (favor hot numbers)."""
-        print("\n🎯 CONSERVATIVE APPROACH (Favor Hot Numbers)")
-        print("="*50)
-        
-        # Weight hot numbers more heavily
-        hot_weight = 0.7
-        cold_weight = 0.1
-        neutral_weight = 0.2
-        
-        # Create weighted selection pool
-        selection_pool = []
-        
-        # Add hot numbers with high weight
-        for num, z_score, count in self.hot_numbers:
-            weight = int(hot_weight * 100)
-            selection_pool.extend([num] * weight)
-        
-        # Add cold numbers with low weight
-        for num, z_score, count in self.cold_numbers:
-            weight = int(cold_weight * 10)
-            selection_pool.extend([num] * weight)
-        
-        # Add neutral numbers (not hot or cold)
-        neutral_numbers = [num for num in range(1, 70) 
-                          if not any(num == hot[0] for hot in self.hot_numbers) and
-                          not any(num == cold[0] for cold in self.cold_numbers)]
-        for num in neutral_numbers:
-            weight = int(neutral_weight * 20)
-            selection_pool.extend([num] * weight)
-        
-        # Generate 5 unique white balls
-        white_balls = []
-        while len(white_balls) < 5:
-            num = random.choice(selection_pool)
-            if num not in white_balls:
-                white_balls.append(num)
-        
-        # Generate powerball (favor hot powerballs)
-        pb_pool = []
-        for num, z_score, count in self.hot_powerballs:
-            weight = int(0.8 * 50)
-            pb_pool.extend([num] * weight)
-        
-        # Add neutral powerballs
-        neutral_pbs = [num for num in range(1, 27) 
-                      if not any(num == hot[0] for hot in self.hot_powerballs) and
-                      not any(num == cold[0] for cold in self.cold_powerballs)]
-        for num in neutral_pbs:
-            pb_pool.extend([num] * 10)
-        
-        powerball = random.choice(pb_pool)
+        white_balls, powerballs = self.generate_conservative_batch(1)
+        return white_balls[0].tolist(), int(powerballs[0])
+    
+    def generate_conservative_batch(self, n):
+        """Generate n conservative sets at once as (n, 5) sorted white balls and (n,) powerballs."""
+        # White balls weighted towards hot numbers via Gumbel top-k
+        scores = self.rng.gumbel(size=(n, 69)) + self.conservative_logp
+        white_balls = np.sort(np.argpartition(-scores, 5, axis=1)[:, :5] + 1, axis=1)
         
-        return sorted(white_balls), powerball
+        # Powerballs favor hot powerballs
+        u = self.rng.random(n) * self.conservative_pb_cdf[-1]
+        powerballs = np.searchsorted(self.conservative_pb_cdf, u, side='right')
+        
+        return white_balls, powerballs
     
     def generate_balanced_numbers(self):
         """Generate numbers using balanced approach (mix of hot and cold)."""
-        print("\n⚖️  BALANCED APPROACH (Mix Hot and Cold)")
-        print("="*50)
-        
         # Select 2-3 hot numbers, 1-2 cold numbers, 1-2 neutral
-        white_balls = []
-        
-        # Add 2-3 hot numbers
-        hot_count = random.randint(2, 3)
-        hot_selected = random.sample([num for num, _, _ in self.hot_numbers], hot_count)
-        white_balls.extend(hot_selected)
-        
-        # Add 1-2 cold numbers
-        cold_count = random.randint(1, 2)
-        cold_selected = random.sample([num for num, _, _ in self.cold_numbers], cold_count)
-        white_balls.extend(cold_selected)
+        hot_count = int(self.rng.integers(2, 4))
+        cold_count = int(self.rng.integers(1, 3))
+        hot_selected = self.rng.choice(self.hot_nums, hot_count, replace=False)
+        cold_selected = self.rng.choice(self.cold_nums, cold_count, replace=False)
         
         # Fill remaining with neutral numbers
-        remaining = 5 - len(white_balls)
-        neutral_numbers = [num for num in range(1, 70) 
-                          if num not in white_balls and
-                          not any(num == hot[0] for hot in self.hot_numbers) and
-                          not any(num == cold[0] for cold in self.cold_numbers)]
-        neutral_selected = random.sample(neutral_numbers, remaining)
-        white_balls.extend(neutral_selected)
+        remaining = 5 - hot_count - cold_count
+        neutral_selected = self.rng.choice(self.neutral_white, remaining, replace=False)
+        white_balls = np.concatenate([hot_selected, cold_selected, neutral_selected]).tolist()
         
         # Generate powerball (balanced)
-        if self.hot_powerballs and random.random() < 0.6:  # 60% chance for hot powerball
-            powerball = random.choice([num for num, _, _ in self.hot_powerballs])
+        if self.hot_pb_nums.size and self.rng.random() < 0.6:  # 60% chance for hot powerball
+            powerball = int(self.rng.choice(self.hot_pb_nums))
         else:  # 40% chance for neutral powerball
-            neutral_pbs = [num for num in range(1, 27) 
-                          if not any(num == hot[0] for hot in self.hot_powerballs) and
-                          not any(num == cold[0] for cold in self.cold_powerballs)]
-            powerball = random.choice(neutral_pbs)
+            powerball = int(self.rng.choice(self.neutral_pb))
         
         return sorted(white_balls), powerball
     
     def generate_contrarian_numbers(self):
         """Generate numbers using contrarian approach (favor cold numbers)."""
-        print("\n🔄 CONTRARIAN APPROACH (Favor Cold Numbers)")
-        print("="*50)
-        
-        # Weight cold numbers more heavily (contrarian strategy)
-        white_balls = []
-        
-        # Add 3-4 cold numbers
-        cold_count = random.randint(3, 4)
-        cold_selected = random.sample([num for num, _, _ in self.cold_numbers], cold_count)
-        white_balls.extend(cold_selected)
+        # Weight cold numbers more heavily (contrarian strategy): 3-4 cold numbers
+        cold_count = int(self.rng.integers(3, 5))
+        cold_selected = self.rng.choice(self.cold_nums, cold_count, replace=False)
         
         # Fill remaining with neutral numbers
-        remaining = 5 - len(white_balls)
-        neutral_numbers = [num for num in range(1, 70) 
-                          if num not in white_balls and
-                          not any(num == hot[0] for hot in self.hot_numbers) and
-                          not any(num == cold[0] for cold in self.cold_numbers)]
-        neutral_selected = random.sample(neutral_numbers, remaining)
-        white_balls.extend(neutral_selected)
+        remaining = 5 - cold_count
+        neutral_selected = self.rng.choice(self.neutral_white, remaining, replace=False)
+        white_balls = np.concatenate([cold_selected, neutral_selected]).tolist()
         
         # Generate powerball (contrarian)
-        if self.cold_powerballs and random.random() < 0.7:  # 70% chance for cold powerball
-            powerball = random.choice([num for num, _, _ in self.cold_powerballs])
+        if self.cold_pb_nums.size and self.rng.random() < 0.7:  # 70% chance for cold powerball
+            powerball = int(self.rng.choice(self.cold_pb_nums))
         else:  # 30% chance for neutral powerball
-            neutral_pbs = [num for num in range(1, 27) 
-                          if not any(num == hot[0] for hot in self.hot_powerballs) and
-                          not any(num == cold[0] for cold in self.cold_numbers)]
-            powerball = random.choice(neutral_pbs)
+            neutral_pbs = np.flatnonzero(~self.is_hot_pb & ~self.is_cold[:27])[1:]
+            powerball = int(self.rng.choice(neutral_pbs))
         
         return sorted(white_balls), powerball
     
     def generate_pattern_based_numbers(self):
         """Generate numbers based on historical patterns."""
-        print("\n🔍 PATTERN-BASED APPROACH (Historical Patterns)")
-        print("="*50)
-        
         # Analyze historical patterns
         white_balls = []
-        
-        # Position-based selection (from our analysis)
-        position_preferences = {
-            0: [1, 2, 3, 4, 5],  # 1st position (lowest)
-            1: [12, 21, 28, 16, 15],  # 2nd position
-            2: [37, 33, 35, 34, 32],  # 3rd position (middle)
-            3: [52, 53, 45, 47, 39],  # 4th position
-            4: [69, 59, 58, 67, 68]   # 5th position (highest)
-        }
+        chosen = np.zeros(70, dtype=bool)
         
         # Select one number from each position preference
-        for pos in range(5):
-            preferred_nums = position_preferences[pos]
+        for preferred_nums in self.position_preferences:
             # Weight towards hot numbers in this position
-            hot_in_position = [num for num in preferred_nums if num in [hot[0] for hot in self.hot_numbers]]
-            if hot_in_position and random.random() < 0.7:
-                white_balls.append(random.choice(hot_in_position))
+            hot_in_position = preferred_nums[self.is_hot[preferred_nums]]
+            if hot_in_position.size and self.rng.random() < 0.7:
+                selected = int(self.rng.choice(hot_in_position))
             else:
-                white_balls.append(random.choice(preferred_nums))
+                selected = int(self.rng.choice(preferred_nums))
+            
+            # Drop repeats; they are refilled below
+            if not chosen[selected]:
+                chosen[selected] = True
+                white_balls.append(selected)
         
         # Ensure uniqueness
-        while len(set(white_balls)) < 5:
-            white_balls = list(set(white_balls))
-            remaining = 5 - len(white_balls)
-            neutral_numbers = [num for num in range(1, 70) if num not in white_balls]
-            white_balls.extend(random.sample(neutral_numbers, remaining))
+        remaining = 5 - len(white_balls)
+        if remaining > 0:
+            available = np.flatnonzero(~chosen[1:]) + 1
+            white_balls.extend(self.rng.choice(available, remaining, replace=False).tolist())
         
         # Generate powerball based on historical frequency
-        pb_freq = Counter(self.powerballs)
-        most_common_pbs = [num for num, count in pb_freq.most_common(10)]
-        powerball = random.choice(most_common_pbs)
+        powerball = int(self.rng.choice(self.top10_pb))
         
         return sorted(white_balls), powerball
     
     def generate_random_numbers(self):
         """Generate completely random numbers (baseline)."""
-        print("\n🎲 RANDOM APPROACH (Pure Random)")
-        print("="*50)
-        
-        white_balls = sorted(random.sample(range(1, 70), 5))
-        powerball = random.randint(1, 26)
+        white_balls, powerballs = self.generate_random_batch(1)
+        return white_balls[0].tolist(), int(powerballs[0])
+    
+    def generate_random_batch(self, n):
+        """Generate n random sets at once as (n, 5) sorted white balls and (n,) powerballs."""
+        white_balls = np.sort(np.argpartition(self.rng.random((n, 69)), 5, axis=1)[:, :5] + 1, axis=1)
+        powerballs = self.rng.integers(1, 27, size=n)
         
-        return white_balls, powerball
+        return white_balls, powerballs
     
     def display_generated_numbers(self, white_balls, powerball, approach_name):
         """Display the generated numbers in a nice format."""
@@ -275,41 +195,59 @@ class IntelligentLotteryGenerator:
         print(f"White Balls: {' '.join(f'{num:02d}' for num in white_balls)}")
         print(f"Powerball: {powerball:02d}")
         
-        # Show analysis of generated numbers
-        hot_count = sum(1 for num in white_balls if num in [hot[0] for hot in self.hot_numbers])
-        cold_count = sum(1 for num in white_balls if num in [cold[0] for cold in self.cold_numbers])
-        neutral_count = 5 - hot_count - cold_count
+        # Show analysis of generated numbers in one pass over their labels
+        cold_count, neutral_count, hot_count = np.bincount(self.label[white_balls], minlength=3).tolist()
         
         print(f"Analysis: {hot_count} hot, {cold_count} cold, {neutral_count} neutral")
         
         # Check if powerball is hot or cold
-        pb_status = "hot" if powerball in [hot[0] for hot in self.hot_powerballs] else "cold" if powerball in [cold[0] for cold in self.cold_powerballs] else "neutral"
+        pb_status = ("cold", "neutral", "hot")[self.pb_label[powerball]]
         print(f"Powerball: {pb_status}")
         
         return white_balls, powerball
     
-    def generate_multiple_sets(self, num_sets=5):
-        """Generate multiple sets of numbers using different approaches."""
-        print("🎰 INTELLIGENT LOTTERY NUMBER GENERATOR")
-        print("="*60)
-        print("Based on advanced pattern analysis of historical data")
-        print("="*60)
+    def generate_multiple_sets(self, num_sets=5, verbose=True):
+        """Generate multiple sets of numbers using different approaches (printing them if verbose)."""
+        if verbose:
+            print("🎰 INTELLIGENT LOTTERY NUMBER GENERATOR")
+            print("="*60)
+            print("Based on advanced pattern analysis of historical data")
+            print("="*60)
         
         approaches = [
-            ("Conservative", self.generate_conservative_numbers),
-            ("Balanced", self.generate_balanced_numbers),
-            ("Contrarian", self.generate_contrarian_numbers),
-            ("Pattern-Based", self.generate_pattern_based_numbers),
-            ("Random", self.generate_random_numbers)
+            ("Conservative", "🎯 CONSERVATIVE APPROACH (Favor Hot Numbers)",
+             self.generate_conservative_numbers, self.generate_conservative_batch),
+            ("Balanced", "⚖️  BALANCED APPROACH (Mix Hot and Cold)",
+             self.generate_balanced_numbers, None),
+            ("Contrarian", "🔄 CONTRARIAN APPROACH (Favor Cold Numbers)",
+             self.generate_contrarian_numbers, None),
+            ("Pattern-Based", "🔍 PATTERN-BASED APPROACH (Historical Patterns)",
+             self.generate_pattern_based_numbers, None),
+            ("Random", "🎲 RANDOM APPROACH (Pure Random)",
+             self.generate_random_numbers, self.generate_random_batch)
         ]
         
+        # Draw every set of the batchable approaches in one call each
+        batches = {}
+        for j, (approach_name, _, _, batch_func) in enumerate(approaches):
+            count = len(range(j, num_sets, len(approaches)))
+            if batch_func is not None and count:
+                white_balls, powerballs = batch_func(count)
+                batches[approach_name] = zip(white_balls.tolist(), powerballs.tolist())
+        
         generated_sets = []
         
         for i in range(num_sets):
-            approach_name, generator_func = approaches[i % len(approaches)]
-            white_balls, powerball = generator_func()
+            approach_name, header, generator_func, _ = approaches[i % len(approaches)]
+            if approach_name in batches:
+                white_balls, powerball = next(batches[approach_name])
+            else:
+                white_balls, powerball = generator_func()
             generated_sets.append((white_balls, powerball, approach_name))
-            self.display_generated_numbers(white_balls, powerball, approach_name)
+            if verbose:
+                print(f"\n{header}")
+                print("="*50)
+                self.display_generated_numbers(white_balls, powerball, approach_name)
         
         return generated_sets
     
@@ -320,20 +258,20 @@ class IntelligentLotteryGenerator:
         print("="*60)
         
         print(f"\n🔥 HOTTEST WHITE BALLS (Z-score > 2):")
-        for i, (num, z_score, count) in enumerate(self.hot_numbers[:10], 1):
-            print(f"   {i:2d}. Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
+        for i in range(min(10, self.hot_nums.size)):
+            print(f"   {i + 1:2d}. Number {self.hot_nums[i]:2d}: Z-score = {self.hot_z[i]:6.2f} ({self.hot_counts[i]:3d} times)")
         
         print(f"\n❄️  COLDEST WHITE BALLS (Z-score < -2):")
-        for i, (num, z_score, count) in enumerate(self.cold_numbers[:10], 1):
-            print(f"   {i:2d}. Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
+        for i in range(min(10, self.cold_nums.size)):
+            print(f"   {i + 1:2d}. Number {self.cold_nums[i]:2d}: Z-score = {self.cold_z[i]:6.2f} ({self.cold_counts[i]:3d} times)")
         
         print(f"\n🎯 HOTTEST POWERBALLS (Z-score > 1.5):")
-        for i, (num, z_score, count) in enumerate(self.hot_powerballs[:5], 1):
-            print(f"   {i:2d}. Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
+        for i in range(min(5, self.hot_pb_nums.size)):
+            print(f"   {i + 1:2d}. Number {self.hot_pb_nums[i]:2d}: Z-score = {self.hot_pb_z[i]:6.2f} ({self.hot_pb_counts[i]:3d} times)")
         
         print(f"\n❄️  COLDEST POWERBALLS (Z-score < -1.5):")
-        for i, (num, z_score, count) in enumerate(self.cold_powerballs[:5], 1):
-            print(f"   {i:2d}. Number {num:2d}: Z-score = {z_score:6.2f} ({count:3d} times)")
+        for i in range(min(5, self.cold_pb_nums.size)):
+            print(f"   {i + 1:2d}. Number {self.cold_pb_nums[i]:2d}: Z-score = {self.cold_pb_z[i]:6.2f} ({self.cold_pb_counts[i]:3d} times)")
 
 def main():
     """Main function to run the intelligent lottery generator."""
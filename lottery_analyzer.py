@@ -6,10 +6,14 @@ Analyzes lottery data to find patterns, frequencies, and statistical insights.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # charts are written to PNG; no GUI backend or blocking window
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
+from lottery_data import prepare_arrays
+from lottery_stats import most_common
 from datetime import datetime
+from functools import cached_property
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -18,31 +22,35 @@ class LotteryAnalyzer:
         """Initialize the analyzer with lottery data."""
         self.csv_file = csv_file
         self.df = None
-        self.white_balls = []
-        self.powerballs = []
+        self.white = None
+        self.pb = None
         self.load_data()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
-        
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        
-        # Extract white balls (first 5) and powerball (last number)
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
-        
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
+        # Parsed numbers and per-draw features, shared with simple_visualization
+        draws = prepare_arrays(self.csv_file)
+        self.df = pd.DataFrame({'Draw Date': draws.dates, 'Multiplier': draws.multiplier, 'Sum': draws.sums})
+        self.white = draws.white
+        self.pb = draws.pb
+        self.sums = draws.sums
+        self.even_counts = draws.even_counts
+        self.even_freq = np.bincount(self.even_counts, minlength=6)
+        self.mult_freq = np.bincount(draws.multiplier, minlength=11)
+        self.consecutive_pairs = draws.consecutive_pairs
+        
+        # Frequency of each number, indexed by number
+        self.white_freq = draws.white_freq
+        self.pb_freq = draws.pb_freq
         
         print(f"Loaded {len(self.df)} lottery draws from {self.df['Draw Date'].min().strftime('%Y-%m-%d')} to {self.df['Draw Date'].max().strftime('%Y-%m-%d')}")
     
+    @cached_property
+    def white_ranked(self):
+        """White balls ranked most frequent first, computed on first use."""
+        return most_common(self.white, self.white_freq)
+    
     def basic_stats(self):
         """Display basic statistics about the data."""
         print("\n" + "="*60)
@@ -59,25 +67,31 @@ class LotteryAnalyzer:
         print("NUMBER FREQUENCY ANALYSIS")
         print("="*60)
         
-        # White ball frequencies
-        white_freq = Counter(self.white_balls)
-        powerball_freq = Counter(self.powerballs)
+        # White ball frequencies, ranked most frequent first
+        white_freq = self.white_freq
+        powerball_freq = self.pb_freq
+        white_ranked = self.white_ranked
+        pb_ranked = most_common(self.pb, powerball_freq)
         
         print("\nTOP 10 MOST FREQUENT WHITE BALLS:")
-        for num, count in white_freq.most_common(10):
-            print(f"Number {num:2d}: {count:3d} times ({count/len(self.white_balls)*100:.1f}%)")
+        for num in white_ranked[:10]:
+            count = white_freq[num]
+            print(f"Number {num:2d}: {count:3d} times ({count/self.white.size*100:.1f}%)")
         
         print("\nTOP 10 LEAST FREQUENT WHITE BALLS:")
-        for num, count in white_freq.most_common()[-10:]:
-            print(f"Number {num:2d}: {count:3d} times ({count/len(self.white_balls)*100:.1f}%)")
+        for num in white_ranked[-10:]:
+            count = white_freq[num]
+            print(f"Number {num:2d}: {count:3d} times ({count/self.white.size*100:.1f}%)")
         
         print("\nTOP 10 MOST FREQUENT POWERBALLS:")
-        for num, count in powerball_freq.most_common(10):
-            print(f"Number {num:2d}: {count:3d} times ({count/len(self.powerballs)*100:.1f}%)")
+        for num in pb_ranked[:10]:
+            count = powerball_freq[num]
+            print(f"Number {num:2d}: {count:3d} times ({count/self.pb.size*100:.1f}%)")
         
         print("\nTOP 10 LEAST FREQUENT POWERBALLS:")
-        for num, count in powerball_freq.most_common()[-10:]:
-            print(f"Number {num:2d}: {count:3d} times ({count/len(self.powerballs)*100:.1f}%)")
+        for num in pb_ranked[-10:]:
+            count = powerball_freq[num]
+            print(f"Number {num:2d}: {count:3d} times ({count/self.pb.size*100:.1f}%)")
         
         return white_freq, powerball_freq
     
@@ -87,24 +101,26 @@ class LotteryAnalyzer:
         print(f"HOT & COLD NUMBERS (Last {recent_draws} draws)")
         print("="*60)
         
-        recent_data = self.df.tail(recent_draws)
-        recent_white_balls = [num for sublist in recent_data['White Balls'] for num in sublist]
-        recent_powerballs = recent_data['Powerball'].tolist()
+        # Draws are in date order, so the most recent ones are a view on the tail
+        recent_white = self.white[-recent_draws:]
+        recent_pb = self.pb[-recent_draws:]
         
-        recent_white_freq = Counter(recent_white_balls)
-        recent_powerball_freq = Counter(recent_powerballs)
+        recent_white_freq = np.bincount(recent_white.ravel(), minlength=70)
+        recent_powerball_freq = np.bincount(recent_pb, minlength=27)
+        white_ranked = most_common(recent_white, recent_white_freq)
+        pb_ranked = most_common(recent_pb, recent_powerball_freq)
         
         print(f"\nHOT WHITE BALLS (Last {recent_draws} draws):")
-        for num, count in recent_white_freq.most_common(10):
-            print(f"Number {num:2d}: {count:3d} times")
+        for num in white_ranked[:10]:
+            print(f"Number {num:2d}: {recent_white_freq[num]:3d} times")
         
         print(f"\nCOLD WHITE BALLS (Last {recent_draws} draws):")
-        for num, count in recent_white_freq.most_common()[-10:]:
-            print(f"Number {num:2d}: {count:3d} times")
+        for num in white_ranked[-10:]:
+            print(f"Number {num:2d}: {recent_white_freq[num]:3d} times")
         
         print(f"\nHOT POWERBALLS (Last {recent_draws} draws):")
-        for num, count in recent_powerball_freq.most_common(10):
-            print(f"Number {num:2d}: {count:3d} times")
+        for num in pb_ranked[:10]:
+            print(f"Number {num:2d}: {recent_powerball_freq[num]:3d} times")
     
     def consecutive_analysis(self):
         """Analyze consecutive numbers in winning combinations."""
@@ -112,25 +128,15 @@ class LotteryAnalyzer:
         print("CONSECUTIVE NUMBER ANALYSIS")
         print("="*60)
         
-        consecutive_count = 0
-        consecutive_examples = []
-        
-        for _, row in self.df.iterrows():
-            white_balls = sorted(row['White Balls'])
-            consecutive_in_draw = 0
-            
-            for i in range(len(white_balls) - 1):
-                if white_balls[i+1] - white_balls[i] == 1:
-                    consecutive_in_draw += 1
-            
-            if consecutive_in_draw > 0:
-                consecutive_count += 1
-                if len(consecutive_examples) < 10:
-                    consecutive_examples.append((row['Draw Date'], white_balls, consecutive_in_draw))
+        pairs_per_draw = self.consecutive_pairs
+        consecutive_count = int((pairs_per_draw > 0).sum())
+        
+        idx = np.flatnonzero(pairs_per_draw)[:10]
+        consecutive_examples = zip(self.df['Draw Date'].iloc[idx], np.sort(self.white[idx], axis=1).tolist(), pairs_per_draw[idx])
         
         print(f"Draws with consecutive numbers: {consecutive_count} out of {len(self.df)} ({consecutive_count/len(self.df)*100:.1f}%)")
         
-        if consecutive_examples:
+        if consecutive_count:
             print("\nExamples of consecutive numbers:")
             for date, numbers, count in consecutive_examples:
                 print(f"{date.strftime('%Y-%m-%d')}: {numbers} ({count} consecutive pairs)")
@@ -141,7 +147,7 @@ class LotteryAnalyzer:
         print("SUM ANALYSIS")
         print("="*60)
         
-        self.df['Sum'] = self.df['White Balls'].apply(sum)
+        sums = self.sums
         
         print(f"Average sum of white balls: {self.df['Sum'].mean():.1f}")
         print(f"Median sum of white balls: {self.df['Sum'].median():.1f}")
@@ -158,9 +164,12 @@ class LotteryAnalyzer:
             (250, 300, "High")
         ]
         
+        # Count every range in one pass; the extra open-ended bin keeps the last range half-open
+        edges = [min_sum for min_sum, _, _ in sum_ranges] + [sum_ranges[-1][1], np.inf]
+        range_counts = np.histogram(sums, bins=edges)[0]
+        
         print("\nSum distribution:")
-        for min_sum, max_sum, label in sum_ranges:
-            count = len(self.df[(self.df['Sum'] >= min_sum) & (self.df['Sum'] < max_sum)])
+        for (min_sum, max_sum, label), count in zip(sum_ranges, range_counts):
             percentage = count / len(self.df) * 100
             print(f"{label:12s} ({min_sum:3d}-{max_sum:3d}): {count:3d} draws ({percentage:4.1f}%)")
     
@@ -170,18 +179,13 @@ class LotteryAnalyzer:
         print("EVEN/ODD PATTERN ANALYSIS")
         print("="*60)
         
-        even_odd_patterns = []
-        for _, row in self.df.iterrows():
-            white_balls = row['White Balls']
-            even_count = sum(1 for num in white_balls if num % 2 == 0)
-            odd_count = 5 - even_count
-            pattern = f"{even_count}E-{odd_count}O"
-            even_odd_patterns.append(pattern)
-        
-        pattern_freq = Counter(even_odd_patterns)
+        pattern_freq = self.even_freq
+        pattern_order = most_common(self.even_counts, pattern_freq)
         
         print("Even/Odd patterns in white balls:")
-        for pattern, count in pattern_freq.most_common():
+        for even_count in pattern_order:
+            pattern = f"{even_count}E-{5 - even_count}O"
+            count = pattern_freq[even_count]
             percentage = count / len(self.df) * 100
             print(f"{pattern:6s}: {count:3d} times ({percentage:4.1f}%)")
     
@@ -193,115 +197,71 @@ class LotteryAnalyzer:
         
         # Set up the plotting style
         plt.style.use('default')
-        fig = plt.figure(figsize=(20, 15))
-        
-        # 1. White ball frequency
-        white_freq = Counter(self.white_balls)
-        plt.subplot(3, 3, 1)
-        numbers = list(range(1, 70))
-        frequencies = [white_freq.get(num, 0) for num in numbers]
-        plt.bar(numbers, frequencies, alpha=0.7)
-        plt.title('White Ball Frequency (1-69)')
-        plt.xlabel('Number')
-        plt.ylabel('Frequency')
-        plt.xticks(range(1, 70, 5))
-        
-        # 2. Powerball frequency
-        powerball_freq = Counter(self.powerballs)
-        plt.subplot(3, 3, 2)
-        pb_numbers = list(range(1, 27))
-        pb_frequencies = [powerball_freq.get(num, 0) for num in pb_numbers]
-        plt.bar(pb_numbers, pb_frequencies, alpha=0.7, color='red')
-        plt.title('Powerball Frequency (1-26)')
-        plt.xlabel('Number')
-        plt.ylabel('Frequency')
-        
-        # 3. Sum distribution
-        plt.subplot(3, 3, 3)
-        self.df['Sum'] = self.df['White Balls'].apply(sum)
-        plt.hist(self.df['Sum'], bins=30, alpha=0.7, edgecolor='black')
-        plt.title('Distribution of White Ball Sums')
-        plt.xlabel('Sum of White Balls')
-        plt.ylabel('Frequency')
-        
-        # 4. Top 20 most frequent white balls
-        plt.subplot(3, 3, 4)
-        top_20 = white_freq.most_common(20)
-        nums, freqs = zip(*top_20)
-        plt.bar(range(len(nums)), freqs, alpha=0.7)
-        plt.title('Top 20 Most Frequent White Balls')
-        plt.xlabel('Rank')
-        plt.ylabel('Frequency')
-        plt.xticks(range(0, len(nums), 2), [str(nums[i]) for i in range(0, len(nums), 2)])
-        
-        # 5. Even/Odd patterns
-        plt.subplot(3, 3, 5)
-        even_odd_patterns = []
-        for _, row in self.df.iterrows():
-            white_balls = row['White Balls']
-            even_count = sum(1 for num in white_balls if num % 2 == 0)
-            odd_count = 5 - even_count
-            pattern = f"{even_count}E-{odd_count}O"
-            even_odd_patterns.append(pattern)
-        
-        pattern_freq = Counter(even_odd_patterns)
-        patterns, counts = zip(*pattern_freq.most_common())
-        plt.bar(patterns, counts, alpha=0.7)
-        plt.title('Even/Odd Patterns')
-        plt.xlabel('Pattern')
-        plt.ylabel('Frequency')
-        plt.xticks(rotation=45)
-        
-        # 6. Recent frequency (last 100 draws)
-        plt.subplot(3, 3, 6)
-        recent_data = self.df.tail(100)
-        recent_white_balls = [num for sublist in recent_data['White Balls'] for num in sublist]
-        recent_freq = Counter(recent_white_balls)
-        recent_nums = list(range(1, 70))
-        recent_frequencies = [recent_freq.get(num, 0) for num in recent_nums]
-        plt.bar(recent_nums, recent_frequencies, alpha=0.7, color='orange')
-        plt.title('White Ball Frequency (Last 100 Draws)')
-        plt.xlabel('Number')
-        plt.ylabel('Frequency')
-        plt.xticks(range(1, 70, 5))
-        
-        # 7. Time series of sums
-        plt.subplot(3, 3, 7)
-        plt.plot(self.df['Draw Date'], self.df['Sum'], alpha=0.6, linewidth=0.8)
-        plt.title('White Ball Sum Over Time')
-        plt.xlabel('Date')
-        plt.ylabel('Sum')
-        plt.xticks(rotation=45)
-        
-        # 8. Multiplier analysis
-        plt.subplot(3, 3, 8)
-        multiplier_freq = Counter(self.df['Multiplier'])
-        multipliers, mult_counts = zip(*multiplier_freq.most_common())
-        plt.bar(multipliers, mult_counts, alpha=0.7, color='green')
-        plt.title('Multiplier Frequency')
-        plt.xlabel('Multiplier')
-        plt.ylabel('Frequency')
-        
-        # 9. Number range analysis
-        plt.subplot(3, 3, 9)
+        fig, axes = plt.subplots(3, 3, figsize=(20, 15))
+        
+        # Panel data, computed up front
+        numbers = np.arange(1, 70)
+        pb_numbers = np.arange(1, 27)
+        
+        nums = self.white_ranked[:20]
+        freqs = self.white_freq[nums]
+        
+        pattern_order = most_common(self.even_counts, self.even_freq)
+        patterns = [f"{even_count}E-{5 - even_count}O" for even_count in pattern_order]
+        
+        recent_frequencies = np.bincount(self.white[-100:].ravel(), minlength=70)[1:70]
+        
+        # Bin 0 holds draws without a recorded multiplier
+        multipliers = np.flatnonzero(self.mult_freq[1:]) + 1
+        mult_counts = self.mult_freq[multipliers]
+        
         ranges = ['1-10', '11-20', '21-30', '31-40', '41-50', '51-60', '61-69']
-        range_counts = []
-        for i in range(7):
-            start = i * 10 + 1
-            end = min((i + 1) * 10, 69)
-            count = sum(1 for num in self.white_balls if start <= num <= end)
-            range_counts.append(count)
-        
-        plt.bar(ranges, range_counts, alpha=0.7, color='purple')
-        plt.title('White Ball Distribution by Range')
-        plt.xlabel('Number Range')
-        plt.ylabel('Frequency')
-        plt.xticks(rotation=45)
+        buckets = np.minimum((self.white.ravel() - 1) // 10, 6)
+        range_counts = np.bincount(buckets, minlength=7)
+        
+        # One (title, xlabel, ylabel, kind, x, y, style) spec per panel, in grid order
+        panels = [
+            ('White Ball Frequency (1-69)', 'Number', 'Frequency',
+             'bar', numbers, self.white_freq[1:70], {'alpha': 0.7}),
+            ('Powerball Frequency (1-26)', 'Number', 'Frequency',
+             'bar', pb_numbers, self.pb_freq[1:27], {'alpha': 0.7, 'color': 'red'}),
+            ('Distribution of White Ball Sums', 'Sum of White Balls', 'Frequency',
+             'hist', None, self.df['Sum'], {'bins': 30, 'alpha': 0.7, 'edgecolor': 'black'}),
+            ('Top 20 Most Frequent White Balls', 'Rank', 'Frequency',
+             'bar', np.arange(len(nums)), freqs, {'alpha': 0.7}),
+            ('Even/Odd Patterns', 'Pattern', 'Frequency',
+             'bar', patterns, self.even_freq[pattern_order], {'alpha': 0.7}),
+            ('White Ball Frequency (Last 100 Draws)', 'Number', 'Frequency',
+             'bar', numbers, recent_frequencies, {'alpha': 0.7, 'color': 'orange'}),
+            ('White Ball Sum Over Time', 'Date', 'Sum',
+             'plot', self.df['Draw Date'], self.df['Sum'], {'alpha': 0.6, 'linewidth': 0.8}),
+            ('Multiplier Frequency', 'Multiplier', 'Frequency',
+             'bar', multipliers, mult_counts, {'alpha': 0.7, 'color': 'green'}),
+            ('White Ball Distribution by Range', 'Number Range', 'Frequency',
+             'bar', ranges, range_counts, {'alpha': 0.7, 'color': 'purple'}),
+        ]
+        
+        for ax, (title, xlabel, ylabel, kind, x, y, style) in zip(axes.flat, panels):
+            if kind == 'hist':
+                ax.hist(y, **style)
+            else:
+                getattr(ax, kind)(x, y, **style)
+            ax.set_title(title)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+        
+        # Tick tweaks: sparse number ticks, ranked labels, and rotated category/date labels
+        axes[0, 0].set_xticks(range(1, 70, 5))
+        axes[1, 0].set_xticks(range(0, len(nums), 2))
+        axes[1, 0].set_xticklabels([str(nums[i]) for i in range(0, len(nums), 2)])
+        axes[1, 2].set_xticks(range(1, 70, 5))
+        for ax in (axes[1, 1], axes[2, 0], axes[2, 2]):
+            ax.tick_params(axis='x', rotation=45)
         
         plt.tight_layout()
-        plt.savefig('lottery_analysis.png', dpi=300, bbox_inches='tight')
+        plt.savefig('lottery_analysis.png', dpi=150, bbox_inches='tight')
         print("Visualizations saved as 'lottery_analysis.png'")
-        plt.show()
+        plt.close(fig)
     
     def run_full_analysis(self):
         """Run the complete lottery analysis."""
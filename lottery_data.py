@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Shared Powerball CSV loader.
+Parses the winning-numbers file once per process so every analyzer can reuse it.
+"""
+
+import contextlib
+import csv
+import os
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+def _source_key(path):
+    """Modification time (ns) and size of a file, identifying the version a cache was built from."""
+    st = os.stat(path)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+@lru_cache(maxsize=4)
+def load_draws(path):
+    """Load draw dates, multipliers and the (draws, 6) int8 number matrix (cached; do not mutate the result).
+    
+    The parsed arrays are saved to '<path>.npz' and reused while the CSV's mtime and size match.
+    """
+    cache_path = path + '.npz'
+    source = _source_key(path)
+    # A missing, stale or unreadable cache is a miss; the CSV is parsed again below
+    try:
+        with np.load(cache_path) as cache:
+            if 'source' in cache.files and np.array_equal(cache['source'], source):
+                return cache['dates'], cache['multiplier'], cache['nums']
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        pass
+    
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        date_idx, nums_idx, mult_idx = (header.index(name) for name in ('Draw Date', 'Winning Numbers', 'Multiplier'))
+        rows = [(row[date_idx], row[nums_idx], row[mult_idx]) for row in reader]
+    
+    # MM/DD/YYYY -> ISO so NumPy can parse the dates; a blank multiplier means none was recorded
+    dates = np.array([f"{d[6:10]}-{d[0:2]}-{d[3:5]}" for d, _, _ in rows], dtype='datetime64[us]')
+    multiplier = np.array([int(m) if m else 0 for _, _, m in rows], dtype=np.int8)
+    nums = np.array([n.split(' ') for _, n, _ in rows], dtype=np.int8)
+    
+    # Caching is best effort; a read-only data directory just means parsing every run.
+    # Write to a temporary file and rename it so no reader ever sees a half-written cache
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(cache_path)),
+                                         suffix='.npz', delete=False) as tmp:
+            tmp_path = tmp.name
+            np.savez(tmp, source=source, dates=dates, multiplier=multiplier, nums=nums)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+    return dates, multiplier, nums
+
+@dataclass
+class DrawArrays:
+    """Per-draw arrays and number frequencies shared by the analyzer and visualizations."""
+    dates: np.ndarray              # datetime64, one per draw
+    multiplier: np.ndarray         # int8, 0 where no multiplier was recorded
+    white: np.ndarray              # int8, (draws, 5)
+    pb: np.ndarray                 # int8, one powerball per draw
+    sums: np.ndarray               # int16, white-ball sum per draw
+    even_counts: np.ndarray        # int8, even white balls per draw
+    consecutive_pairs: np.ndarray  # int8, adjacent sorted white balls that differ by one
+    white_freq: np.ndarray         # indexed by number, 0..69
+    pb_freq: np.ndarray            # indexed by number, 0..max drawn
+
+@lru_cache(maxsize=4)
+def prepare_arrays(path):
+    """Load the draws in date order and compute their per-draw features (cached; do not mutate the result)."""
+    dates, multiplier, nums = load_draws(path)
+    
+    # The CSV is not in draw order; sort once so time series and "last N draws" need no re-sort
+    order = np.argsort(dates, kind='stable')
+    dates, multiplier, nums = dates[order], multiplier[order], nums[order]
+    white = nums[:, :5]
+    pb = nums[:, 5]
+    
+    return DrawArrays(
+        dates=dates,
+        multiplier=multiplier,
+        white=white,
+        pb=pb,
+        sums=white.sum(axis=1, dtype=np.int16),
+        even_counts=((white & 1) == 0).sum(axis=1, dtype=np.int8),
+        consecutive_pairs=(np.diff(np.sort(white, axis=1), axis=1) == 1).sum(axis=1, dtype=np.int8),
+        white_freq=np.bincount(white.ravel(), minlength=70),
+        pb_freq=np.bincount(pb, minlength=27),
+    )
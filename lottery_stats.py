@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Shared Powerball frequency statistics.
+Counts, expected frequencies and Z-scores computed once and reused by the generators and rankings.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from lottery_data import load_draws
+
+def heat_scores(counts, expected):
+    """Return Z-scores and 0-100 heat index for observed counts against an expected count."""
+    # Z-score of +3 = 100, Z-score of -3 = 0, Z-score of 0 = 50
+    z = (counts.astype(np.float32) - np.float32(expected)) / np.float32(np.sqrt(expected))
+    heat = np.clip(50.0 + 16.67 * z, 0.0, 100.0)
+    return z, heat
+
+@dataclass
+class LotteryStats:
+    """Ball arrays, frequency counts and Z-scores for one results file."""
+    white_arr: np.ndarray     # all white balls, flattened
+    pb_arr: np.ndarray        # one powerball per draw
+    white_counts: np.ndarray  # uint16, indexed by number, 0..69
+    pb_counts: np.ndarray     # uint16, indexed by number, 0..max drawn
+    expected_white: float
+    expected_pb: float
+    z_white: np.ndarray       # float32, numbers 1-69
+    z_pb: np.ndarray          # float32, numbers 1-26
+    heat_white: np.ndarray
+    heat_pb: np.ndarray
+
+    @classmethod
+    def from_csv(cls, path):
+        """Load the results file and compute all frequency statistics."""
+        # Winning numbers as a (draws, 6) int8 array; draw dates are not needed here
+        _, _, nums = load_draws(path)
+        return cls.from_arrays(nums[:, :5].ravel(), nums[:, 5])
+
+    @classmethod
+    def from_arrays(cls, white_arr, pb_arr):
+        """Compute all frequency statistics from flattened white balls and per-draw powerballs."""
+        white_counts = np.bincount(white_arr, minlength=70).astype(np.uint16)
+        pb_counts = np.bincount(pb_arr, minlength=27).astype(np.uint16)
+        expected_white = white_arr.size / 69
+        expected_pb = pb_arr.size / 26
+        z_white, heat_white = heat_scores(white_counts[1:], expected_white)
+        z_pb, heat_pb = heat_scores(pb_counts[1:27], expected_pb)
+        
+        return cls(white_arr, pb_arr, white_counts, pb_counts, expected_white, expected_pb,
+                   z_white, z_pb, heat_white, heat_pb)
+
+def z_score_extremes(z, counts, threshold):
+    """Return hot and cold (nums, z_scores, counts) arrays from the Z-scores of numbers 1..len(z), strongest first.
+    
+    z is a LotteryStats Z-score array; counts is indexed by number, like LotteryStats.white_counts.
+    """
+    hot = np.flatnonzero(z > threshold)
+    cold = np.flatnonzero(z < -threshold)
+    hot_nums = (hot[np.argsort(-z[hot], kind='stable')] + 1).astype(np.int8)
+    cold_nums = (cold[np.argsort(z[cold], kind='stable')] + 1).astype(np.int8)
+    return ((hot_nums, z[hot_nums - 1], counts[hot_nums].astype(np.int16)),
+            (cold_nums, z[cold_nums - 1], counts[cold_nums].astype(np.int16)))
+
+def extreme_tuples(nums, z, counts):
+    """(number, z_score, count) tuples from parallel z_score_extremes arrays, for display."""
+    return list(zip(nums.tolist(), z.tolist(), counts.tolist()))
+
+def most_common(values, counts):
+    """Numbers present in values, most frequent first (ties in first-seen order, like Counter.most_common)."""
+    nums, first = np.unique(values, return_index=True)
+    return nums[np.lexsort((first, -counts[nums].astype(np.int64)))]
@@ -4,235 +4,237 @@ Smart Lottery Number Generator
 Uses pattern analysis to generate intelligent lottery numbers.
 """
 
-import pandas as pd
+import sys
 import numpy as np
-import random
-from collections import Counter
+from lottery_data import load_draws
+from lottery_stats import LotteryStats, extreme_tuples, z_score_extremes
 import warnings
 warnings.filterwarnings('ignore')
 
 class SmartLotteryGenerator:
-    def __init__(self, csv_file):
-        """Initialize the generator with lottery data."""
+    # Every white ball number, for set-difference fills
+    ALL_WHITE = frozenset(range(1, 70))
+    
+    # Position preferences from our analysis, one row per sorted position
+    position_preferences = np.array([
+        [1, 2, 3, 4, 5],       # 1st position (lowest)
+        [12, 21, 28, 16, 15],  # 2nd position
+        [37, 33, 35, 34, 32],  # 3rd position (middle)
+        [52, 53, 45, 47, 39],  # 4th position
+        [69, 59, 58, 67, 68]   # 5th position (highest)
+    ], dtype=np.int8)
+    
+    def __init__(self, csv_file, stats=None):
+        """Initialize the generator with lottery data, optionally reusing precomputed LotteryStats."""
         self.csv_file = csv_file
-        self.df = None
-        self.white_balls = []
-        self.powerballs = []
-        self.hot_numbers = []
-        self.cold_numbers = []
+        self.stats = stats
+        self.rng = np.random.default_rng()
         self.load_data()
         self.analyze_patterns()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data for smart generation...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
-        
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
+        # Winning numbers as a (draws, 6) int8 matrix in file order; reused from the .npz cache when current
+        _, _, nums = load_draws(self.csv_file)
+        self.white_mat = nums[:, :5]
+        self.pb_arr = nums[:, 5]
+        self.white_arr = self.white_mat.ravel()
         
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
+        # Frequencies shared with the other generators and the heat rankings
+        if self.stats is None:
+            self.stats = LotteryStats.from_arrays(self.white_arr, self.pb_arr)
         
-        print(f"Loaded {len(self.df)} lottery draws")
+        print(f"Loaded {len(self.pb_arr)} lottery draws")
     
     def analyze_patterns(self):
         """Analyze patterns to identify hot/cold numbers."""
         print("Analyzing patterns...")
         
-        # Calculate frequencies
-        white_freq = Counter(self.white_balls)
-        pb_freq = Counter(self.powerballs)
+        # Identify hot and cold numbers using Z-scores (beyond +/-2), sorted by Z-score
+        ((self.hot_nums, self.hot_z, self.hot_counts),
+         (self.cold_nums, self.cold_z, self.cold_counts)) = z_score_extremes(self.stats.z_white, self.stats.white_counts, 2)
         
-        # Calculate expected frequencies
-        expected_white = len(self.white_balls) / 69
-        expected_pb = len(self.powerballs) / 26
+        # Membership masks by ball number and the hot numbers within each position's preferences, built once
+        self._hot_mask = np.zeros(70, dtype=bool)
+        self._hot_mask[self.hot_nums] = True
+        self._cold_mask = np.zeros(70, dtype=bool)
+        self._cold_mask[self.cold_nums] = True
+        self._pos_hot_in = [prefs[self._hot_mask[prefs]] for prefs in self.position_preferences]
         
-        # Identify hot and cold numbers using Z-scores
-        self.hot_numbers = []
-        self.cold_numbers = []
-        
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_white) / np.sqrt(expected_white)
-            if z_score > 2:  # Hot numbers
-                self.hot_numbers.append((num, z_score, observed_count))
-            elif z_score < -2:  # Cold numbers
-                self.cold_numbers.append((num, z_score, observed_count))
-        
-        # Sort by Z-score
-        self.hot_numbers.sort(key=lambda x: x[1], reverse=True)
-        self.cold_numbers.sort(key=lambda x: x[1])
-        
-        print(f"Found {len(self.hot_numbers)} hot numbers and {len(self.cold_numbers)} cold numbers")
+        print(f"Found {self.hot_nums.size} hot numbers and {self.cold_nums.size} cold numbers")
+    
+    @property
+    def hot_numbers(self):
+        """Hot white balls as (number, z_score, count) tuples, hottest first."""
+        return extreme_tuples(self.hot_nums, self.hot_z, self.hot_counts)
+    
+    @property
+    def cold_numbers(self):
+        """Cold white balls as (number, z_score, count) tuples, coldest first."""
+        return extreme_tuples(self.cold_nums, self.cold_z, self.cold_counts)
     
     def generate_hot_strategy(self):
         """Generate numbers favoring hot numbers."""
-        print("\n🔥 HOT STRATEGY (Favor Hot Numbers)")
-        print("="*40)
-        
         white_balls = []
         
         # Select 3-4 hot numbers
-        hot_count = random.randint(3, 4)
-        hot_selected = random.sample([num for num, _, _ in self.hot_numbers], hot_count)
+        hot_count = int(self.rng.integers(3, 5))
+        hot_selected = self.rng.choice(self.hot_nums, hot_count, replace=False).tolist()
         white_balls.extend(hot_selected)
         
         # Fill remaining with random numbers
         remaining = 5 - len(white_balls)
-        all_numbers = list(range(1, 70))
-        available = [num for num in all_numbers if num not in white_balls]
-        white_balls.extend(random.sample(available, remaining))
+        available = list(self.ALL_WHITE.difference(white_balls))
+        white_balls.extend(self.rng.choice(available, remaining, replace=False).tolist())
         
         # Generate powerball
-        powerball = random.randint(1, 26)
+        powerball = int(self.rng.integers(1, 27))
         
         return sorted(white_balls), powerball
     
     def generate_cold_strategy(self):
         """Generate numbers favoring cold numbers (contrarian)."""
-        print("\n❄️  COLD STRATEGY (Favor Cold Numbers)")
-        print("="*40)
-        
         white_balls = []
         
         # Select 3-4 cold numbers
-        cold_count = random.randint(3, 4)
-        cold_selected = random.sample([num for num, _, _ in self.cold_numbers], cold_count)
+        cold_count = int(self.rng.integers(3, 5))
+        cold_selected = self.rng.choice(self.cold_nums, cold_count, replace=False).tolist()
         white_balls.extend(cold_selected)
         
         # Fill remaining with random numbers
         remaining = 5 - len(white_balls)
-        all_numbers = list(range(1, 70))
-        available = [num for num in all_numbers if num not in white_balls]
-        white_balls.extend(random.sample(available, remaining))
+        available = list(self.ALL_WHITE.difference(white_balls))
+        white_balls.extend(self.rng.choice(available, remaining, replace=False).tolist())
         
         # Generate powerball
-        powerball = random.randint(1, 26)
+        powerball = int(self.rng.integers(1, 27))
         
         return sorted(white_balls), powerball
     
     def generate_balanced_strategy(self):
         """Generate numbers with balanced approach."""
-        print("\n⚖️  BALANCED STRATEGY (Mix Hot and Cold)")
-        print("="*40)
-        
         white_balls = []
         
         # Select 2 hot numbers
-        if self.hot_numbers:
-            hot_selected = random.sample([num for num, _, _ in self.hot_numbers], min(2, len(self.hot_numbers)))
+        if self.hot_nums.size:
+            hot_selected = self.rng.choice(self.hot_nums, min(2, self.hot_nums.size), replace=False).tolist()
             white_balls.extend(hot_selected)
         
         # Select 2 cold numbers
-        if self.cold_numbers:
-            cold_selected = random.sample([num for num, _, _ in self.cold_numbers], min(2, len(self.cold_numbers)))
+        if self.cold_nums.size:
+            cold_selected = self.rng.choice(self.cold_nums, min(2, self.cold_nums.size), replace=False).tolist()
             white_balls.extend(cold_selected)
         
         # Fill remaining with random numbers
         remaining = 5 - len(white_balls)
-        all_numbers = list(range(1, 70))
-        available = [num for num in all_numbers if num not in white_balls]
-        white_balls.extend(random.sample(available, remaining))
+        available = list(self.ALL_WHITE.difference(white_balls))
+        white_balls.extend(self.rng.choice(available, remaining, replace=False).tolist())
         
         # Generate powerball
-        powerball = random.randint(1, 26)
+        powerball = int(self.rng.integers(1, 27))
         
         return sorted(white_balls), powerball
     
     def generate_position_strategy(self):
         """Generate numbers based on position preferences."""
-        print("\n🎯 POSITION STRATEGY (Historical Position Patterns)")
-        print("="*40)
-        
-        # Position preferences from our analysis
-        position_preferences = {
-            0: [1, 2, 3, 4, 5],  # 1st position (lowest)
-            1: [12, 21, 28, 16, 15],  # 2nd position
-            2: [37, 33, 35, 34, 32],  # 3rd position (middle)
-            3: [52, 53, 45, 47, 39],  # 4th position
-            4: [69, 59, 58, 67, 68]   # 5th position (highest)
-        }
-        
         white_balls = []
+        picked = 0  # bit n is set once number n has been chosen
         
         # Select one number from each position preference
         for pos in range(5):
-            preferred_nums = position_preferences[pos]
+            preferred_nums = self.position_preferences[pos]
             # Weight towards hot numbers in this position
-            hot_in_position = [num for num in preferred_nums if num in [hot[0] for hot in self.hot_numbers]]
-            if hot_in_position and random.random() < 0.7:
-                white_balls.append(random.choice(hot_in_position))
+            hot_in_position = self._pos_hot_in[pos]
+            if hot_in_position.size and self.rng.random() < 0.7:
+                selected = int(self.rng.choice(hot_in_position))
             else:
-                white_balls.append(random.choice(preferred_nums))
-        
-        # Ensure uniqueness
-        while len(set(white_balls)) < 5:
-            white_balls = list(set(white_balls))
-            remaining = 5 - len(white_balls)
-            all_numbers = list(range(1, 70))
-            available = [num for num in all_numbers if num not in white_balls]
-            white_balls.extend(random.sample(available, remaining))
+                selected = int(self.rng.choice(preferred_nums))
+            # Ensure uniqueness: a repeated pick is redrawn until it lands on an unused number
+            while (picked >> selected) & 1:
+                selected = int(self.rng.integers(1, 70))
+            white_balls.append(selected)
+            picked |= 1 << selected
         
         # Generate powerball
-        powerball = random.randint(1, 26)
+        powerball = int(self.rng.integers(1, 27))
         
         return sorted(white_balls), powerball
     
     def generate_random_strategy(self):
         """Generate completely random numbers."""
-        print("\n🎲 RANDOM STRATEGY (Pure Random)")
-        print("="*40)
-        
-        white_balls = sorted(random.sample(range(1, 70), 5))
-        powerball = random.randint(1, 26)
-        
-        return white_balls, powerball
+        white_balls, powerballs = self.generate_random_batch(1)
+        return white_balls[0].tolist(), int(powerballs[0])
     
-    def display_numbers(self, white_balls, powerball, strategy_name):
-        """Display the generated numbers."""
-        print(f"\n{strategy_name} Generated Numbers:")
-        print(f"White Balls: {' '.join(f'{num:02d}' for num in white_balls)}")
-        print(f"Powerball: {powerball:02d}")
+    def generate_random_batch(self, n):
+        """Generate n random sets at once as (n, 5) sorted white balls and (n,) powerballs."""
+        white_balls = np.sort(np.argpartition(self.rng.random((n, 69)), 5, axis=1)[:, :5] + 1, axis=1)
+        powerballs = self.rng.integers(1, 27, size=n)
         
+        return white_balls, powerballs
+    
+    def format_numbers(self, white_balls, powerball, strategy_name):
+        """Format the generated numbers and their analysis as a single string."""
         # Show analysis
-        hot_count = sum(1 for num in white_balls if num in [hot[0] for hot in self.hot_numbers])
-        cold_count = sum(1 for num in white_balls if num in [cold[0] for cold in self.cold_numbers])
+        arr = np.asarray(white_balls)
+        hot_count = int(self._hot_mask[arr].sum())
+        cold_count = int(self._cold_mask[arr].sum())
         neutral_count = 5 - hot_count - cold_count
         
-        print(f"Analysis: {hot_count} hot, {cold_count} cold, {neutral_count} neutral")
-        
+        return "\n".join([
+            f"\n{strategy_name} Generated Numbers:",
+            f"White Balls: {' '.join(f'{num:02d}' for num in white_balls)}",
+            f"Powerball: {powerball:02d}",
+            f"Analysis: {hot_count} hot, {cold_count} cold, {neutral_count} neutral",
+        ])
+    
+    def display_numbers(self, white_balls, powerball, strategy_name):
+        """Display the generated numbers."""
+        sys.stdout.write(self.format_numbers(white_balls, powerball, strategy_name) + "\n")
         return white_balls, powerball
     
     def generate_multiple_sets(self, num_sets=5):
         """Generate multiple sets of numbers using different strategies."""
-        print("🎰 SMART LOTTERY NUMBER GENERATOR")
-        print("="*50)
-        print("Based on advanced pattern analysis")
-        print("="*50)
-        
         strategies = [
-            ("Hot Strategy", self.generate_hot_strategy),
-            ("Cold Strategy", self.generate_cold_strategy),
-            ("Balanced Strategy", self.generate_balanced_strategy),
-            ("Position Strategy", self.generate_position_strategy),
-            ("Random Strategy", self.generate_random_strategy)
+            ("Hot Strategy", "🔥 HOT STRATEGY (Favor Hot Numbers)",
+             self.generate_hot_strategy, None),
+            ("Cold Strategy", "❄️  COLD STRATEGY (Favor Cold Numbers)",
+             self.generate_cold_strategy, None),
+            ("Balanced Strategy", "⚖️  BALANCED STRATEGY (Mix Hot and Cold)",
+             self.generate_balanced_strategy, None),
+            ("Position Strategy", "🎯 POSITION STRATEGY (Historical Position Patterns)",
+             self.generate_position_strategy, None),
+            ("Random Strategy", "🎲 RANDOM STRATEGY (Pure Random)",
+             self.generate_random_strategy, self.generate_random_batch)
         ]
         
+        # Draw every set of the batchable strategies in one call each
+        batches = {}
+        for j, (strategy_name, _, _, batch_func) in enumerate(strategies):
+            count = len(range(j, num_sets, len(strategies)))
+            if batch_func is not None and count:
+                white_balls, powerballs = batch_func(count)
+                batches[strategy_name] = zip(white_balls.tolist(), powerballs.tolist())
+        
         generated_sets = []
         
+        # Collect the whole report and write it once
+        lines = [
+            "🎰 SMART LOTTERY NUMBER GENERATOR",
+            "="*50,
+            "Based on advanced pattern analysis",
+            "="*50,
+        ]
         for i in range(num_sets):
-            strategy_name, generator_func = strategies[i % len(strategies)]
-            white_balls, powerball = generator_func()
+            strategy_name, header, generator_func, _ = strategies[i % len(strategies)]
+            if strategy_name in batches:
+                white_balls, powerball = next(batches[strategy_name])
+            else:
+                white_balls, powerball = generator_func()
             generated_sets.append((white_balls, powerball, strategy_name))
-            self.display_numbers(white_balls, powerball, strategy_name)
+            lines.extend([f"\n{header}", "="*40, self.format_numbers(white_balls, powerball, strategy_name)])
         
+        sys.stdout.write("\n".join(lines) + "\n")
         return generated_sets
     
     def show_analysis(self):
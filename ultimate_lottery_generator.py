@@ -4,344 +4,344 @@ Ultimate Lottery Number Generator
 Uses ALL advanced pattern analysis findings to generate the most intelligent selections possible.
 """
 
-import pandas as pd
+import sys
 import numpy as np
-import random
-from collections import Counter
+from lottery_data import load_draws
+from lottery_stats import LotteryStats, extreme_tuples, most_common, z_score_extremes
 import warnings
 warnings.filterwarnings('ignore')
 
 class UltimateLotteryGenerator:
-    def __init__(self, csv_file):
-        """Initialize the ultimate generator with lottery data."""
+    # Every white ball number, for set-difference fills
+    ALL_WHITE = frozenset(range(1, 70))
+    
+    def __init__(self, csv_file, stats=None):
+        """Initialize the ultimate generator with lottery data, optionally reusing precomputed LotteryStats."""
         self.csv_file = csv_file
-        self.df = None
-        self.white_balls = []
-        self.powerballs = []
-        self.hot_numbers = []
-        self.cold_numbers = []
-        self.hot_powerballs = []
-        self.cold_powerballs = []
-        self.position_preferences = {}
+        self.stats = stats
+        self.rng = np.random.default_rng()
         self.load_data()
         self.analyze_all_patterns()
     
     def load_data(self):
         """Load and preprocess the lottery data."""
         print("Loading lottery data for ultimate generation...")
-        self.df = pd.read_csv(self.csv_file)
-        
-        # Convert date column
-        self.df['Draw Date'] = pd.to_datetime(self.df['Draw Date'])
-        
-        # Parse winning numbers
-        self.df['Numbers'] = self.df['Winning Numbers'].str.split()
-        self.df['White Balls'] = self.df['Numbers'].apply(lambda x: [int(n) for n in x[:5]])
-        self.df['Powerball'] = self.df['Numbers'].apply(lambda x: int(x[5]))
-        
-        # Flatten all white balls and powerballs for analysis
-        self.white_balls = [num for sublist in self.df['White Balls'] for num in sublist]
-        self.powerballs = self.df['Powerball'].tolist()
-        
-        print(f"Loaded {len(self.df)} lottery draws")
+        # Winning numbers as a (draws, 6) int8 matrix in file order; reused from the .npz cache when current
+        _, _, nums = load_draws(self.csv_file)
+        self.white_mat = nums[:, :5]
+        self.pb_arr = nums[:, 5]
+        self.white_arr = self.white_mat.ravel()
+        self.sorted_white_mat = np.sort(self.white_mat, axis=1)
+        
+        # Frequencies shared with the other generators and the heat rankings
+        if self.stats is None:
+            self.stats = LotteryStats.from_arrays(self.white_arr, self.pb_arr)
+        
+        print(f"Loaded {len(self.pb_arr)} lottery draws")
     
     def analyze_all_patterns(self):
         """Analyze ALL patterns from our advanced analysis."""
         print("Analyzing ALL patterns for ultimate generation...")
         
-        # Calculate frequencies
-        white_freq = Counter(self.white_balls)
-        pb_freq = Counter(self.powerballs)
-        
-        # Calculate expected frequencies
-        expected_white = len(self.white_balls) / 69
-        expected_pb = len(self.powerballs) / 26
-        
-        # Identify hot and cold numbers using Z-scores
-        self.hot_numbers = []
-        self.cold_numbers = []
-        
-        for num in range(1, 70):
-            observed_count = white_freq.get(num, 0)
-            z_score = (observed_count - expected_white) / np.sqrt(expected_white)
-            if z_score > 2:  # Hot numbers
-                self.hot_numbers.append((num, z_score, observed_count))
-            elif z_score < -2:  # Cold numbers
-                self.cold_numbers.append((num, z_score, observed_count))
-        
-        # Sort by Z-score
-        self.hot_numbers.sort(key=lambda x: x[1], reverse=True)
-        self.cold_numbers.sort(key=lambda x: x[1])
-        
-        # Identify hot and cold powerballs
-        self.hot_powerballs = []
-        self.cold_powerballs = []
-        
-        for num in range(1, 27):
-            observed_count = pb_freq.get(num, 0)
-            z_score = (observed_count - expected_pb) / np.sqrt(expected_pb)
-            if z_score > 1.5:  # Hot powerballs
-                self.hot_powerballs.append((num, z_score, observed_count))
-            elif z_score < -1.5:  # Cold powerballs
-                self.cold_powerballs.append((num, z_score, observed_count))
-        
-        # Sort by Z-score
-        self.hot_powerballs.sort(key=lambda x: x[1], reverse=True)
-        self.cold_powerballs.sort(key=lambda x: x[1])
+        stats = self.stats
+        
+        # Identify hot and cold numbers using Z-scores (beyond +/-2), sorted by Z-score
+        ((self.hot_nums, self.hot_z, self.hot_counts),
+         (self.cold_nums, self.cold_z, self.cold_counts)) = z_score_extremes(stats.z_white, stats.white_counts, 2)
+        
+        # Identify hot and cold powerballs (beyond +/-1.5)
+        ((self.hot_pb_nums, self.hot_pb_z, self.hot_pb_counts),
+         (self.cold_pb_nums, self.cold_pb_z, self.cold_pb_counts)) = z_score_extremes(stats.z_pb, stats.pb_counts, 1.5)
+        
+        # Frequency-weighted selection probabilities for white balls 1-69 and powerballs 1-26:
+        # counts scaled down, but every number keeps weight >= 1
+        white_weights = np.maximum(1, stats.white_counts[1:] // 10)
+        pb_weights = np.maximum(1, stats.pb_counts[1:27] // 5)
+        self._white_p = white_weights / white_weights.sum()
+        self._white_logp = np.log(self._white_p)
+        self._pb_p = pb_weights / pb_weights.sum()
         
         # Analyze position preferences
         self.analyze_position_patterns()
         
-        print(f"Found {len(self.hot_numbers)} hot white balls, {len(self.cold_numbers)} cold white balls")
-        print(f"Found {len(self.hot_powerballs)} hot powerballs, {len(self.cold_powerballs)} cold powerballs")
+        # Membership masks by ball number; powerballs from earlier game rules run past 26
+        pb_size = int(self.pb_arr.max()) + 1
+        self._hot_mask = self._number_mask(self.hot_nums, 70)
+        self._cold_mask = self._number_mask(self.cold_nums, 70)
+        self._hot_pb_mask = self._number_mask(self.hot_pb_nums, pb_size)
+        self._cold_pb_mask = self._number_mask(self.cold_pb_nums, pb_size)
+        self._all_preferred = tuple(dict.fromkeys(self.pos_pref_mat.ravel().tolist()))
+        
+        # Hot numbers within each position's preferences as a (5, 5) matrix for batch sampling,
+        # zero-padded past each position's count
+        hot_in = self._hot_mask[self.pos_pref_mat]
+        self._pos_hot_counts = hot_in.sum(axis=1)
+        self._pos_hot_mat = np.zeros((5, 5), dtype=np.int8)
+        for pos in range(5):
+            self._pos_hot_mat[pos, :self._pos_hot_counts[pos]] = self.pos_pref_mat[pos, hot_in[pos]]
+        
+        # Frequency rankings (Counter.most_common order) shared by the strategies and the report
+        self._pb_most_common = [(int(num), int(stats.pb_counts[num]))
+                                for num in most_common(self.pb_arr, stats.pb_counts)]
+        self._least_frequent_whites = tuple(most_common(self.white_arr, stats.white_counts)[-20:].tolist())
+        
+        # Powerball candidates for the strategies, ranked most frequent first
+        pb_ranked = [num for num, count in self._pb_most_common]
+        self._most_common_pbs10 = tuple(pb_ranked[:10])
+        self._most_common_pbs5 = tuple(pb_ranked[:5])
+        self._least_common_pbs10 = tuple(pb_ranked[-10:])
+        
+        print(f"Found {self.hot_nums.size} hot white balls, {self.cold_nums.size} cold white balls")
+        print(f"Found {self.hot_pb_nums.size} hot powerballs, {self.cold_pb_nums.size} cold powerballs")
+    
+    @property
+    def hot_numbers(self):
+        """Hot white balls as (number, z_score, count) tuples, hottest first."""
+        return extreme_tuples(self.hot_nums, self.hot_z, self.hot_counts)
+    
+    @property
+    def cold_numbers(self):
+        """Cold white balls as (number, z_score, count) tuples, coldest first."""
+        return extreme_tuples(self.cold_nums, self.cold_z, self.cold_counts)
+    
+    @property
+    def hot_powerballs(self):
+        """Hot powerballs as (number, z_score, count) tuples, hottest first."""
+        return extreme_tuples(self.hot_pb_nums, self.hot_pb_z, self.hot_pb_counts)
+    
+    @property
+    def cold_powerballs(self):
+        """Cold powerballs as (number, z_score, count) tuples, coldest first."""
+        return extreme_tuples(self.cold_pb_nums, self.cold_pb_z, self.cold_pb_counts)
+    
+    @property
+    def position_preferences(self):
+        """Top 5 numbers for each sorted position, as {position: [numbers]}."""
+        return {pos: row.tolist() for pos, row in enumerate(self.pos_pref_mat)}
+    
+    @staticmethod
+    def _number_mask(numbers, size):
+        """Boolean lookup array indexed by ball number, True for the given numbers."""
+        mask = np.zeros(size, dtype=bool)
+        mask[numbers] = True
+        return mask
     
     def analyze_position_patterns(self):
         """Analyze position-specific patterns."""
-        position_freq = {i: Counter() for i in range(5)}
-        
-        for _, row in self.df.iterrows():
-            sorted_nums = sorted(row['White Balls'])
-            for pos, num in enumerate(sorted_nums):
-                position_freq[pos][num] += 1
-        
-        # Get top 5 numbers for each position
-        self.position_preferences = {}
+        # Get top 5 numbers for each position of the draws sorted in load_data, one row per position
+        self.pos_pref_mat = np.zeros((5, 5), dtype=np.int8)
         for pos in range(5):
-            top_numbers = [num for num, count in position_freq[pos].most_common(5)]
-            self.position_preferences[pos] = top_numbers
+            column = self.sorted_white_mat[:, pos]
+            counts = np.bincount(column, minlength=70)
+            self.pos_pref_mat[pos] = most_common(column, counts)[:5]
     
     def generate_ultimate_strategy(self):
         """Generate numbers using the ultimate strategy combining ALL findings."""
-        print("\n🚀 ULTIMATE STRATEGY (All Advanced Findings)")
-        print("="*50)
-        
-        white_balls = []
-        
-        # Strategy: Use position preferences with hot number bias
-        for pos in range(5):
-            preferred_nums = self.position_preferences[pos]
-            
-            # Weight towards hot numbers in this position
-            hot_in_position = [num for num in preferred_nums if num in [hot[0] for hot in self.hot_numbers]]
-            
-            if hot_in_position and random.random() < 0.8:  # 80% chance for hot
-                selected = random.choice(hot_in_position)
-            else:
-                selected = random.choice(preferred_nums)
-            
-            white_balls.append(selected)
-        
-        # Ensure uniqueness
-        while len(set(white_balls)) < 5:
-            white_balls = list(set(white_balls))
-            remaining = 5 - len(white_balls)
-            all_numbers = list(range(1, 70))
-            available = [num for num in all_numbers if num not in white_balls]
-            white_balls.extend(random.sample(available, remaining))
-        
-        # Generate powerball using frequency-based selection
-        pb_freq = Counter(self.powerballs)
-        most_common_pbs = [num for num, count in pb_freq.most_common(10)]
-        powerball = random.choice(most_common_pbs)
-        
-        return sorted(white_balls), powerball
+        white_balls, powerballs = self.generate_ultimate_batch(1)
+        return white_balls[0].tolist(), int(powerballs[0])
+    
+    def generate_ultimate_batch(self, n):
+        """Generate n ultimate-strategy sets at once as (n, 5) sorted white balls and (n,) powerballs."""
+        # Strategy: Use position preferences with hot number bias (80% chance for hot where a position has any)
+        pos = np.arange(5)
+        use_hot = (self._pos_hot_counts > 0) & (self.rng.random((n, 5)) < 0.8)
+        hot_idx = (self.rng.random((n, 5)) * self._pos_hot_counts).astype(np.int64)
+        pref_idx = self.rng.integers(0, 5, size=(n, 5))
+        white_balls = np.sort(np.where(use_hot, self._pos_hot_mat[pos, hot_idx], self.pos_pref_mat[pos, pref_idx]), axis=1)
+        
+        # Ensure uniqueness: replace repeated picks with random numbers not already in the row
+        dup = np.zeros((n, 5), dtype=bool)
+        dup[:, 1:] = white_balls[:, 1:] == white_balls[:, :-1]
+        rows = np.flatnonzero(dup.any(axis=1))
+        if rows.size:
+            visited = np.zeros((rows.size, 70), dtype=bool)
+            visited[:, 0] = True
+            visited[np.arange(rows.size)[:, None], white_balls[rows]] = True
+            scores = np.where(visited, -1.0, self.rng.random((rows.size, 70)))
+            fill = np.argsort(-scores, axis=1)[:, :4]
+            slot = np.cumsum(dup[rows], axis=1) - 1
+            sub = white_balls[rows]
+            sub[dup[rows]] = fill[np.nonzero(dup[rows])[0], slot[dup[rows]]]
+            white_balls[rows] = np.sort(sub, axis=1)
+        
+        # Generate powerballs using frequency-based selection
+        powerballs = self.rng.choice(self._most_common_pbs10, size=n)
+        
+        return white_balls, powerballs
     
     def generate_super_hot_strategy(self):
         """Generate numbers using maximum hot number bias."""
-        print("\n🔥 SUPER HOT STRATEGY (Maximum Hot Bias)")
-        print("="*50)
-        
         white_balls = []
         
-        # Select 4-5 hot numbers
-        hot_count = random.randint(4, 5)
-        hot_selected = random.sample([num for num, _, _ in self.hot_numbers], hot_count)
+        # Select 4-5 hot numbers (capped at however many numbers are hot)
+        hot_count = min(int(self.rng.integers(4, 6)), self.hot_nums.size)
+        hot_selected = self.rng.choice(self.hot_nums, hot_count, replace=False).tolist()
         white_balls.extend(hot_selected)
         
         # Fill remaining with position-preferred numbers
         remaining = 5 - len(white_balls)
         if remaining > 0:
-            all_preferred = []
-            for pos in range(5):
-                all_preferred.extend(self.position_preferences[pos])
-            
-            available_preferred = [num for num in all_preferred if num not in white_balls]
+            available_preferred = [num for num in self._all_preferred if num not in white_balls]
             if available_preferred:
-                white_balls.extend(random.sample(available_preferred, min(remaining, len(available_preferred))))
+                white_balls.extend(self.rng.choice(available_preferred, min(remaining, len(available_preferred)), replace=False).tolist())
         
         # Fill any remaining with random
-        while len(white_balls) < 5:
-            all_numbers = list(range(1, 70))
-            available = [num for num in all_numbers if num not in white_balls]
-            white_balls.append(random.choice(available))
+        remaining = 5 - len(white_balls)
+        if remaining > 0:
+            white_balls.extend(self.rng.choice(list(self.ALL_WHITE.difference(white_balls)), remaining, replace=False).tolist())
         
         # Generate powerball (favor most frequent)
-        pb_freq = Counter(self.powerballs)
-        most_common_pbs = [num for num, count in pb_freq.most_common(5)]
-        powerball = random.choice(most_common_pbs)
+        powerball = int(self.rng.choice(self._most_common_pbs5))
         
         return sorted(white_balls), powerball
     
     def generate_contrarian_ultimate(self):
         """Generate numbers using ultimate contrarian strategy."""
-        print("\n🔄 ULTIMATE CONTRARIAN (Maximum Cold Bias)")
-        print("="*50)
-        
         white_balls = []
         
         # Select 4-5 cold numbers
-        cold_count = random.randint(4, 5)
-        cold_selected = random.sample([num for num, _, _ in self.cold_numbers], cold_count)
+        cold_count = int(self.rng.integers(4, 6))
+        cold_selected = self.rng.choice(self.cold_nums, cold_count, replace=False).tolist()
         white_balls.extend(cold_selected)
         
         # Fill remaining with least frequent numbers
         remaining = 5 - len(white_balls)
         if remaining > 0:
-            white_freq = Counter(self.white_balls)
-            least_frequent = [num for num, count in white_freq.most_common()[-20:]]
-            available_least = [num for num in least_frequent if num not in white_balls]
+            available_least = [num for num in self._least_frequent_whites if num not in white_balls]
             if available_least:
-                white_balls.extend(random.sample(available_least, min(remaining, len(available_least))))
+                white_balls.extend(self.rng.choice(available_least, min(remaining, len(available_least)), replace=False).tolist())
         
         # Fill any remaining with random
-        while len(white_balls) < 5:
-            all_numbers = list(range(1, 70))
-            available = [num for num in all_numbers if num not in white_balls]
-            white_balls.append(random.choice(available))
+        remaining = 5 - len(white_balls)
+        if remaining > 0:
+            white_balls.extend(self.rng.choice(list(self.ALL_WHITE.difference(white_balls)), remaining, replace=False).tolist())
         
         # Generate powerball (favor least frequent)
-        pb_freq = Counter(self.powerballs)
-        least_frequent_pbs = [num for num, count in pb_freq.most_common()[-10:]]
-        powerball = random.choice(least_frequent_pbs)
+        powerball = int(self.rng.choice(self._least_common_pbs10))
         
         return sorted(white_balls), powerball
     
     def generate_balanced_ultimate(self):
         """Generate numbers using ultimate balanced strategy."""
-        print("\n⚖️  ULTIMATE BALANCED (Perfect Balance)")
-        print("="*50)
-        
         white_balls = []
         
         # Select 2 hot numbers
-        if self.hot_numbers:
-            hot_selected = random.sample([num for num, _, _ in self.hot_numbers], min(2, len(self.hot_numbers)))
+        if self.hot_nums.size:
+            hot_selected = self.rng.choice(self.hot_nums, min(2, self.hot_nums.size), replace=False).tolist()
             white_balls.extend(hot_selected)
         
         # Select 2 cold numbers
-        if self.cold_numbers:
-            cold_selected = random.sample([num for num, _, _ in self.cold_numbers], min(2, len(self.cold_numbers)))
+        if self.cold_nums.size:
+            cold_selected = self.rng.choice(self.cold_nums, min(2, self.cold_nums.size), replace=False).tolist()
             white_balls.extend(cold_selected)
         
         # Fill remaining with position-preferred numbers
         remaining = 5 - len(white_balls)
         if remaining > 0:
-            all_preferred = []
-            for pos in range(5):
-                all_preferred.extend(self.position_preferences[pos])
-            
-            available_preferred = [num for num in all_preferred if num not in white_balls]
+            available_preferred = [num for num in self._all_preferred if num not in white_balls]
             if available_preferred:
-                white_balls.extend(random.sample(available_preferred, min(remaining, len(available_preferred))))
+                white_balls.extend(self.rng.choice(available_preferred, min(remaining, len(available_preferred)), replace=False).tolist())
         
         # Fill any remaining with random
-        while len(white_balls) < 5:
-            all_numbers = list(range(1, 70))
-            available = [num for num in all_numbers if num not in white_balls]
-            white_balls.append(random.choice(available))
+        remaining = 5 - len(white_balls)
+        if remaining > 0:
+            white_balls.extend(self.rng.choice(list(self.ALL_WHITE.difference(white_balls)), remaining, replace=False).tolist())
         
         # Generate powerball (balanced)
-        pb_freq = Counter(self.powerballs)
-        if random.random() < 0.6:  # 60% chance for frequent
-            most_common_pbs = [num for num, count in pb_freq.most_common(10)]
-            powerball = random.choice(most_common_pbs)
+        if self.rng.random() < 0.6:  # 60% chance for frequent
+            powerball = int(self.rng.choice(self._most_common_pbs10))
         else:  # 40% chance for less frequent
-            least_frequent_pbs = [num for num, count in pb_freq.most_common()[-10:]]
-            powerball = random.choice(least_frequent_pbs)
+            powerball = int(self.rng.choice(self._least_common_pbs10))
         
         return sorted(white_balls), powerball
     
     def generate_frequency_weighted(self):
         """Generate numbers using frequency-weighted selection."""
-        print("\n📊 FREQUENCY-WEIGHTED STRATEGY")
-        print("="*50)
-        
-        # Create weighted selection pool based on actual frequencies
-        white_freq = Counter(self.white_balls)
-        selection_pool = []
-        
-        for num in range(1, 70):
-            count = white_freq.get(num, 0)
-            # Weight by actual frequency (not just hot/cold)
-            weight = max(1, count // 10)  # Scale down but maintain relative weights
-            selection_pool.extend([num] * weight)
-        
-        # Generate 5 unique numbers
-        white_balls = []
-        while len(white_balls) < 5:
-            num = random.choice(selection_pool)
-            if num not in white_balls:
-                white_balls.append(num)
-        
-        # Generate powerball using frequency weighting
-        pb_freq = Counter(self.powerballs)
-        pb_pool = []
-        for num in range(1, 27):
-            count = pb_freq.get(num, 0)
-            weight = max(1, count // 5)
-            pb_pool.extend([num] * weight)
+        white_balls, powerballs = self.generate_frequency_weighted_batch(1)
+        return white_balls[0].tolist(), int(powerballs[0])
+    
+    def generate_frequency_weighted_batch(self, n):
+        """Generate n frequency-weighted sets at once as (n, 5) sorted white balls and (n,) powerballs."""
+        # Weight by actual frequency (not just hot/cold); Gumbel top-k draws 5 unique numbers per row
+        scores = self.rng.gumbel(size=(n, 69)) + self._white_logp
+        white_balls = np.sort(np.argpartition(-scores, 5, axis=1)[:, :5] + 1, axis=1)
         
-        powerball = random.choice(pb_pool)
+        # Generate powerballs using frequency weighting
+        powerballs = self.rng.choice(np.arange(1, 27), size=n, p=self._pb_p)
         
-        return sorted(white_balls), powerball
+        return white_balls, powerballs
     
-    def display_numbers(self, white_balls, powerball, strategy_name):
-        """Display the generated numbers with detailed analysis."""
-        print(f"\n{strategy_name} Generated Numbers:")
-        print(f"White Balls: {' '.join(f'{num:02d}' for num in white_balls)}")
-        print(f"Powerball: {powerball:02d}")
-        
+    def format_numbers(self, white_balls, powerball, strategy_name):
+        """Format the generated numbers with detailed analysis as a single string."""
         # Detailed analysis
-        hot_count = sum(1 for num in white_balls if num in [hot[0] for hot in self.hot_numbers])
-        cold_count = sum(1 for num in white_balls if num in [cold[0] for cold in self.cold_numbers])
+        arr = np.asarray(white_balls)
+        hot_count = int(self._hot_mask[arr].sum())
+        cold_count = int(self._cold_mask[arr].sum())
         neutral_count = 5 - hot_count - cold_count
         
-        print(f"Analysis: {hot_count} hot, {cold_count} cold, {neutral_count} neutral")
-        
         # Check powerball status
-        pb_status = "hot" if powerball in [hot[0] for hot in self.hot_powerballs] else "cold" if powerball in [cold[0] for cold in self.cold_powerballs] else "neutral"
-        print(f"Powerball: {pb_status}")
+        pb_status = "hot" if self._hot_pb_mask[powerball] else "cold" if self._cold_pb_mask[powerball] else "neutral"
         
         # Calculate sum and other stats
-        total_sum = sum(white_balls)
-        even_count = sum(1 for num in white_balls if num % 2 == 0)
-        print(f"Sum: {total_sum}, Even count: {even_count}")
-        
+        total_sum = int(arr.sum())
+        even_count = int((arr & 1 == 0).sum())
+        
+        return "\n".join([
+            f"\n{strategy_name} Generated Numbers:",
+            f"White Balls: {' '.join(f'{num:02d}' for num in white_balls)}",
+            f"Powerball: {powerball:02d}",
+            f"Analysis: {hot_count} hot, {cold_count} cold, {neutral_count} neutral",
+            f"Powerball: {pb_status}",
+            f"Sum: {total_sum}, Even count: {even_count}",
+        ])
+    
+    def display_numbers(self, white_balls, powerball, strategy_name):
+        """Display the generated numbers with detailed analysis."""
+        sys.stdout.write(self.format_numbers(white_balls, powerball, strategy_name) + "\n")
         return white_balls, powerball
     
     def generate_ultimate_sets(self, num_sets=10):
         """Generate multiple sets using ultimate strategies."""
-        print("🎰 ULTIMATE LOTTERY NUMBER GENERATOR")
-        print("="*60)
-        print("Using ALL advanced pattern analysis findings")
-        print("="*60)
-        
         strategies = [
-            ("Ultimate Strategy", self.generate_ultimate_strategy),
-            ("Super Hot Strategy", self.generate_super_hot_strategy),
-            ("Ultimate Contrarian", self.generate_contrarian_ultimate),
-            ("Ultimate Balanced", self.generate_balanced_ultimate),
-            ("Frequency-Weighted", self.generate_frequency_weighted)
+            ("Ultimate Strategy", "🚀 ULTIMATE STRATEGY (All Advanced Findings)",
+             self.generate_ultimate_strategy, self.generate_ultimate_batch),
+            ("Super Hot Strategy", "🔥 SUPER HOT STRATEGY (Maximum Hot Bias)",
+             self.generate_super_hot_strategy, None),
+            ("Ultimate Contrarian", "🔄 ULTIMATE CONTRARIAN (Maximum Cold Bias)",
+             self.generate_contrarian_ultimate, None),
+            ("Ultimate Balanced", "⚖️  ULTIMATE BALANCED (Perfect Balance)",
+             self.generate_balanced_ultimate, None),
+            ("Frequency-Weighted", "📊 FREQUENCY-WEIGHTED STRATEGY",
+             self.generate_frequency_weighted, self.generate_frequency_weighted_batch)
         ]
         
+        # Draw every set of the batchable strategies in one call each
+        batches = {}
+        for j, (strategy_name, _, _, batch_func) in enumerate(strategies):
+            count = len(range(j, num_sets, len(strategies)))
+            if batch_func is not None and count:
+                white_balls, powerballs = batch_func(count)
+                batches[strategy_name] = zip(white_balls.tolist(), powerballs.tolist())
+        
         generated_sets = []
         
+        # Collect the whole report and write it once
+        lines = [
+            "🎰 ULTIMATE LOTTERY NUMBER GENERATOR",
+            "="*60,
+            "Using ALL advanced pattern analysis findings",
+            "="*60,
+        ]
         for i in range(num_sets):
-            strategy_name, generator_func = strategies[i % len(strategies)]
-            white_balls, powerball = generator_func()
+            strategy_name, header, generator_func, _ = strategies[i % len(strategies)]
+            if strategy_name in batches:
+                white_balls, powerball = next(batches[strategy_name])
+            else:
+                white_balls, powerball = generator_func()
             generated_sets.append((white_balls, powerball, strategy_name))
-            self.display_numbers(white_balls, powerball, strategy_name)
+            lines.extend([f"\n{header}", "="*50, self.format_numbers(white_balls, powerball, strategy_name)])
         
+        sys.stdout.write("\n".join(lines) + "\n")
         return generated_sets
     
     def show_complete_analysis(self):
@@ -364,9 +364,8 @@ class UltimateLotteryGenerator:
             print(f"   {positions[pos]:12s}: {self.position_preferences[pos]}")
         
         print(f"\n🎯 POWERBALL ANALYSIS:")
-        pb_freq = Counter(self.powerballs)
-        print(f"   Most frequent: {pb_freq.most_common(1)[0][0]} ({pb_freq.most_common(1)[0][1]} times)")
-        print(f"   Least frequent: {pb_freq.most_common()[-1][0]} ({pb_freq.most_common()[-1][1]} times)")
+        print(f"   Most frequent: {self._pb_most_common[0][0]} ({self._pb_most_common[0][1]} times)")
+        print(f"   Least frequent: {self._pb_most_common[-1][0]} ({self._pb_most_common[-1][1]} times)")
 
 def main():
     """Main function to run the ultimate lottery generator."""